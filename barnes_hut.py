@@ -0,0 +1,181 @@
+"""
+Barnes-Hut quadtree for the graph view's force-directed layout.
+
+Approximates the all-pairs repulsion between nodes in O(N log N):
+- Nodes are inserted into a point-region quadtree that tracks the node
+  count and position sums (centre of mass) of every cell
+- A cell that is small relative to its distance from a node acts on it as
+  a single mass at its centre of mass
+- Nearby nodes (within the separation distance) are always visited one by
+  one, so overlap separation stays exact
+- Cells entirely beyond the repulsion cutoff are skipped without descending
+"""
+
+from typing import List, Optional, Tuple
+import math
+
+
+class QuadCell:
+    """Square cell of the quadtree with its aggregated mass"""
+
+    __slots__ = ('x0', 'y0', 'size', 'mass', 'sx', 'sy', 'children', 'points')
+
+    def __init__(self, x0: float, y0: float, size: float):
+        self.x0 = x0
+        self.y0 = y0
+        self.size = size
+        self.mass = 0  # Number of nodes in this cell
+        self.sx = 0.0  # Sum of node x (centre of mass = sx / mass)
+        self.sy = 0.0
+        self.children: Optional[List[Optional['QuadCell']]] = None
+        self.points: List[int] = []  # Node indices, leaves only
+
+    def contains(self, x: float, y: float) -> bool:
+        return (self.x0 <= x < self.x0 + self.size and
+                self.y0 <= y < self.y0 + self.size)
+
+
+class QuadTree:
+    """Quadtree over node positions (indices into xs/ys)"""
+
+    # Coincident nodes would split forever; below this depth leaves just
+    # collect every node that lands in them
+    MAX_DEPTH = 32
+
+    def __init__(self, xs: List[float], ys: List[float]):
+        self.xs = xs
+        self.ys = ys
+
+        x0 = min(xs)
+        y0 = min(ys)
+        size = max(max(xs) - x0, max(ys) - y0, 1.0) * 1.0001
+        self.root = QuadCell(x0, y0, size)
+
+        for i in range(len(xs)):
+            self._insert(i)
+
+    def _child_for(self, cell: QuadCell, x: float, y: float) -> QuadCell:
+        """Return (creating if needed) the quadrant of cell containing (x, y)"""
+        half = cell.size / 2
+        right = x >= cell.x0 + half
+        below = y >= cell.y0 + half
+        k = int(right) + 2 * int(below)
+        child = cell.children[k]
+        if child is None:
+            child = QuadCell(cell.x0 + half * right, cell.y0 + half * below, half)
+            cell.children[k] = child
+        return child
+
+    def _insert(self, i: int):
+        x = self.xs[i]
+        y = self.ys[i]
+        cell = self.root
+        depth = 0
+        while True:
+            cell.mass += 1
+            cell.sx += x
+            cell.sy += y
+
+            if cell.children is None:
+                if not cell.points or depth >= self.MAX_DEPTH:
+                    cell.points.append(i)
+                    return
+                # Split the leaf and push its node one level down
+                cell.children = [None, None, None, None]
+                for j in cell.points:
+                    child = self._child_for(cell, self.xs[j], self.ys[j])
+                    child.mass += 1
+                    child.sx += self.xs[j]
+                    child.sy += self.ys[j]
+                    child.points.append(j)
+                cell.points = []
+
+            cell = self._child_for(cell, x, y)
+            depth += 1
+
+    def repulsion(
+        self,
+        strength: float,
+        min_separation: float,
+        separation_strength: float,
+        theta: float = 0.7,
+        cutoff: float = math.inf
+    ) -> Tuple[List[float], List[float]]:
+        """
+        Net repulsion + separation force on every node.
+
+        Per pair at distance d the force along the unit vector between them is
+        strength / (d^2 + 1), plus separation_strength * (min_separation - d)
+        while d < min_separation - the same terms as the exact pass in
+        GraphView.apply_physics.
+
+        Args:
+            theta: Opening criterion; a cell of side s at distance d is
+                approximated when s < theta * d (0 = exact)
+            cutoff: Repulsion range; the force is shifted down by its value
+                here so it fades to zero, and cells entirely beyond it are
+                never visited
+
+        Returns:
+            (fx, fy) lists indexed like xs/ys
+        """
+        xs = self.xs
+        ys = self.ys
+        n = len(xs)
+        fx = [0.0] * n
+        fy = [0.0] * n
+        cutoff_sq = cutoff * cutoff
+        shift = strength / (cutoff_sq + 1.0)
+        # Cells beyond the cutoff can only be skipped if separation can't reach them either
+        prune = cutoff >= min_separation
+
+        for i in range(n):
+            x = xs[i]
+            y = ys[i]
+            ax = 0.0
+            ay = 0.0
+            stack = [self.root]
+            while stack:
+                cell = stack.pop()
+
+                if prune:
+                    # Distance from the node to the nearest point of the cell
+                    ex = max(cell.x0 - x, x - cell.x0 - cell.size, 0.0)
+                    ey = max(cell.y0 - y, y - cell.y0 - cell.size, 0.0)
+                    if ex*ex + ey*ey >= cutoff_sq:
+                        continue
+
+                if cell.children is None:
+                    # Leaf: exact interaction with each node in it
+                    for j in cell.points:
+                        if j == i:
+                            continue
+                        dx = xs[j] - x
+                        dy = ys[j] - y
+                        dist_sq = dx*dx + dy*dy
+                        dist = math.sqrt(dist_sq) if dist_sq > 0 else 0.001
+                        c = max(0.0, strength / (dist_sq + 1.0) - shift)
+                        if dist < min_separation:
+                            c += separation_strength * (min_separation - dist)
+                        ax -= c * dx / dist
+                        ay -= c * dy / dist
+                    continue
+
+                dx = cell.sx / cell.mass - x
+                dy = cell.sy / cell.mass - y
+                dist_sq = dx*dx + dy*dy
+                dist = math.sqrt(dist_sq)
+
+                # Far enough to stand in for its nodes (and beyond separation range)
+                if (not cell.contains(x, y) and cell.size < theta * dist
+                        and dist > min_separation + 1.5 * cell.size):
+                    c = cell.mass * max(0.0, strength / (dist_sq + 1.0) - shift)
+                    ax -= c * dx / dist
+                    ay -= c * dy / dist
+                else:
+                    stack.extend(child for child in cell.children if child is not None)
+
+            fx[i] = ax
+            fy[i] = ay
+
+        return fx, fy
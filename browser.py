@@ -1,20 +1,38 @@
 import sys
 import os
 import json
-from PyQt5.QtCore import QUrl, Qt, QPointF, QTimer, QSize, QRect, QEvent, QMetaObject, Q_ARG
-from PyQt5.QtGui import QPainter, QPen, QColor, QFont, QBrush, QRadialGradient, QPainterPath, QPixmap, QIcon, QFontMetrics, QKeySequence
+import sqlite3
+import time
+
+# Chromium reads these once when the web engine starts, so set them before any Qt import.
+# GPU rasterization + zero-copy move page raster work off the CPU; an existing value wins.
+os.environ.setdefault('QTWEBENGINE_CHROMIUM_FLAGS',
+                      '--enable-gpu-rasterization --ignore-gpu-blocklist --enable-zero-copy --num-raster-threads=4')
+
+from PyQt5.QtCore import QUrl, Qt, QPoint, QPointF, QLineF, QTimer, QSize, QRect, QRectF, QEvent, pyqtSignal
+from PyQt5.QtGui import (QPainter, QPen, QColor, QFont, QBrush, QGradient, QRadialGradient, QPainterPath, QPixmap, QPixmapCache, QIcon, QTransform,
+                         QFontMetrics, QPolygon, QKeySequence, QRegion, QTextDocument)
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, QVBoxLayout,
                              QHBoxLayout, QWidget, QLineEdit, QPushButton, QLabel, QShortcut, QListWidget, QListWidgetItem)
-from PyQt5.QtWebEngineWidgets import QWebEngineView
+from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineProfile
 import math
-import random
-from anthropic import Anthropic
+import numpy as np
+from collections import defaultdict, OrderedDict
+from anthropic import Anthropic, DefaultHttpxClient
+import httpx
 import concurrent.futures
+from functools import partial, lru_cache
+from urllib.parse import urlsplit, urlunsplit
+import re
 import threading
 from cluster_summarizer import ClusterSummarizer
-from cluster_search import ClusterSearcher
+from cluster_search import ClusterSearcher, parse_score
 from types import SimpleNamespace
 from spanning_tree import SpanningTreeCalculator, Edge
+from barnes_hut import QuadTree
+from page_embedder import PageEmbedder
+from lexical_similarity import term_vector, cosine as lexical_cosine, url_tokens, jaccard
+from physics_kernels import pair_forces
 
 class GraphView(QWidget):
     """Widget that displays a graph visualization of browser tabs"""
@@ -22,30 +40,69 @@ class GraphView(QWidget):
     def __init__(self, browser):
         super().__init__()
         self.browser = browser
-        self.node_positions = {}
-        self.velocities = {}
+        # Snapshot of the browser's web tabs, refreshed only after invalidate_tabs()
+        self._tabs = None
+        # Snapshot the node rows were last synced against
+        self._laid_out_tabs = None
+        # Node positions and velocities as parallel arrays (one row per node)
+        self._xs = np.zeros(0)
+        self._ys = np.zeros(0)
+        self._vxs = np.zeros(0)
+        # Forces from the previous physics step (velocity Verlet); None after
+        # rows are added or removed
+        self._fxs = None
+        self._fys = None
+        self._vys = np.zeros(0)
+        self._idx_to_row = {}
+        self._row_to_idx = []
         self.dragging_node = None
         self.drag_offset = (0, 0)
         self.drag_start_pos = None
         self.has_dragged = False
+        # Close buttons drawn in the last frame: idx -> (x, y, radius)
+        self.close_button_positions = {}
         self.panning = False
         self.pan_start = None
         self.offset_x = 0
         self.offset_y = 0
         self.zoom = 1.0
+        # Graph -> screen transform for the current pan/zoom, and its inverse
+        self._rebuild_xform()
         self.hovered_node = None
         self.setMinimumSize(800, 600)
         self.setMouseTracking(True)
         # Physics parameters
         self.physics_enabled = True
         self.physics_interval_ms = 33  # ~30 FPS for smoother animation
+        # Simulated seconds per tick; velocity Verlet stays stable at twice the
+        # tick interval, so the layout settles in far fewer ticks
+        self.physics_step = 0.066
         self.attraction_threshold = 0.15
         self.attraction_strength = 0.5  # Gentler attraction
         self.repulsion_strength = 1500.0  # Less aggressive repulsion
+        # Repulsion fades to zero at this distance (graph units); farther pairs
+        # without a similarity spring are skipped
+        self.repulsion_cutoff = 400.0
         # Separation to keep comfortable distances (pixels)
         self.min_separation = 220.0  # More breathing room for larger nodes
         self.separation_strength = 6.0
-        self.damping = 0.90  # Higher damping for smoother settling
+        self.damping = 0.95  # Velocity kept per step; Verlet stays stable with less damping
+        # Below this per-step movement (graph units) the layout counts as settled
+        self.settle_threshold = 0.01
+        # After this many settled ticks in a row the physics timer stops
+        # until wake_physics() (input, tab changes, the view being shown)
+        self.settle_ticks = 10
+        self._settled_ticks = 0
+        # Physics movement below this many screen pixels is not repainted yet;
+        # it accumulates per node in _unpainted_dx/_unpainted_dy
+        self.min_repaint_px = 0.5
+        self._unpainted_dx = None
+        self._unpainted_dy = None
+        # From this many nodes, repulsion uses a Barnes-Hut quadtree instead of
+        # (N, N) arrays (faster and far less memory at that size). The
+        # compiled exact pass stays ahead of the Python quadtree far longer
+        self.barnes_hut_threshold = 2000 if pair_forces is None else 8000
+        self.barnes_hut_theta = 0.7
 
         # Start physics timer
         self._physics_timer = QTimer(self)
@@ -70,95 +127,176 @@ class GraphView(QWidget):
         self.show_mst_only = True
         self.mst_result = None
         self.mst_calculator = SpanningTreeCalculator(min_edge_weight=0.2)
+        # Edge cache, rebuilt only when the browser marks the graph dirty
+        self.edge_threshold = 0.20
+        self._edges = []
+        self._drawn_edges = []
+        self._central_nodes = set()
+        # Pairwise similarity matrix (rows in _sim_order) for the tab snapshot
+        # it was computed from, shared by edges, clustering and physics
+        self._sim_matrix = np.zeros((0, 0))
+        self._sim_order = {}
+        self._sim_tabs = None
+        # Physics' (tabs, _sim_matrix, node order, sims, stiffness, rest) from _spring_terms
+        self._spring_cache = None
+        # Bumped whenever a node moves, so caches of drawn geometry can tell
+        self._layout_version = 0
+        # Last edge paths from _edge_strokes: (_drawn_edges, state, strokes, labels)
+        self._edge_paths = None
+        # Scratch (N, N) arrays for the NumPy force pass
+        self._force_buffers = None
+        # Drawn edges as row arrays: (_drawn_edges, _idx_to_row, row count, rows1, rows2)
+        self._edge_rows = None
+        # Above this fraction of moving nodes a tick repaints the whole widget
+        self.partial_repaint_fraction = 0.5
+        # Paint resources, built once rather than per node/edge on every frame
+        self._font_empty = QFont('SF Pro Display', 14)
+        self._font_label = QFont('SF Pro Display', 9, QFont.Normal)
+        self._font_small = QFont('SF Pro Display', 9)
+        self._font_edge = QFont('SF Pro Display', 9, QFont.Bold)
+        self._font_hover_title = QFont('SF Pro Display', 14, QFont.Bold)
+        self._font_panel_title = QFont('SF Pro Display', 12, QFont.Bold)
+        self._font_panel_desc = QFont('SF Pro Display', 10)
+        self._bg_color = QColor(248, 249, 250)  # Very light gray
+        self._grid_pen = QPen(QColor(220, 222, 225, 100), 1)
+        self._no_pen = QPen(Qt.NoPen)
+        self._shadow_brush = QBrush(QColor(0, 0, 0, 20))
+        self._text_pen = QPen(QColor(60, 64, 67))
+        self._empty_text_pen = QPen(QColor(120, 125, 130))
+        self._close_brush = QBrush(QColor(220, 53, 69))
+        self._close_pen = QPen(QColor(200, 40, 55), 1)
+        self._white_pen = QPen(QColor(255, 255, 255), 2)
+        self._tooltip_brush = QBrush(QColor(50, 55, 60, 240))
+        self._tooltip_pen = QPen(QColor(240, 245, 250))
+        self._popup_shadow_brush = QBrush(QColor(0, 0, 0, 40))
+        self._popup_brush = QBrush(QColor(255, 255, 255, 250))
+        self._popup_pen = QPen(QColor(66, 133, 244), 2)
+        self._edge_label_pen = QPen(QColor(66, 133, 244))
+        self._default_node_color = QColor(245, 247, 250)
+        self._chip_brush = QBrush(QColor(245, 246, 248))
+        self._chip_pen = QPen(QColor(210, 215, 220))
+        self._panel_pen = QPen(QColor(200, 205, 210), 1)
+        self._panel_brush = QBrush(QColor(255, 255, 255, 250))
+        self._panel_close_brush = QBrush(QColor(230, 80, 80))
+        self._panel_close_pen = QPen(QColor(200, 40, 40))
+        self._panel_title_pen = QPen(QColor(34, 40, 49))
+        self._panel_desc_pen = QPen(QColor(70, 76, 82))
+        self._panel_default_color = QColor(180, 180, 180)
+        # Font metrics for the fonts measured while painting
+        self._fm_label = QFontMetrics(self._font_label)
+        self._fm_edge = QFontMetrics(self._font_edge)
+        self._fm_hover_title = QFontMetrics(self._font_hover_title)
+        self._fm_small = QFontMetrics(self._font_small)
+        # Last measured URL tooltip: (text, QRect at the origin)
+        self._tooltip_rect = None
+        # Last hover popup layout: ((title, max width), QTextDocument, width, height)
+        self._hover_title_layout = None
+        # cluster colour rgba -> (border pen, fill brush) for the panel indicator
+        self._indicator_styles = {}
+        # Node brushes/border pens keyed by (color, central, hovered)
+        self._node_styles = {}
+        # Edge pen lookup tables indexed by alpha, one per hover state (normal, hovered)
+        self._edge_pens = ([None] * 256, [None] * 256)
+        # Pre-rendered node sprites (shadow + fill + border) live in QPixmapCache
+        self._sprite_margin = 6  # room for the shadow offset and border around the radius
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 64 * 1024))
+        # Edge score labels ("0.00".."1.00") keyed by (hundredths, scale)
+        self._label_pixmaps = {}
+        # Measured inline node labels: (text, width) -> QRect
+        self._label_rects = {}
+        # Background colour plus one grid cell as a tile: (antialiased, device ratio) -> QPixmap
+        self.grid_size = 40
+        self._grid_tiles = {}
+        self.hit_radius = 116  # Max node radius (updated to match larger nodes)
+        # Graph-space slack when culling off-screen nodes (largest radius + shadow)
+        self.node_cull_margin = 100
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        # Aliased rasterization is much cheaper; skip AA while a drag or pan is in progress
+        interacting = self.panning or (self.dragging_node is not None and self.has_dragged)
+        painter.setRenderHint(QPainter.Antialiasing, not interacting)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, not interacting)
 
-        # Clean modern background (light gray, like modern browsers)
-        bg_color = QColor(248, 249, 250)  # Very light gray
-        painter.fillRect(self.rect(), bg_color)
+        # Only the invalidated area needs repainting (hover updates are small)
+        dirty = event.rect()
 
-        # Subtle dot grid pattern
-        painter.setPen(QPen(QColor(220, 222, 225, 100), 1))
-        grid_size = 40
-        for x in range(0, self.width(), grid_size):
-            for y in range(0, self.height(), grid_size):
-                painter.drawPoint(x, y)
+        # Clean modern background (light gray, like modern browsers) with a
+        # subtle dot grid, blitted from one pre-rendered grid cell
+        grid = self.grid_size
+        painter.drawTiledPixmap(dirty, self._grid_tile(not interacting),
+                                QPoint(dirty.x() % grid, dirty.y() % grid))
 
         # Get all non-graph tabs
-        tabs = self.browser.get_web_tabs()
+        tabs = self.get_tabs()
 
         if not tabs:
-            painter.setPen(QPen(QColor(120, 125, 130)))
-            painter.setFont(QFont('SF Pro Display', 14))
+            painter.setPen(self._empty_text_pen)
+            painter.setFont(self._font_empty)
             painter.drawText(self.rect(), Qt.AlignCenter,
                            "No tabs to display\nOpen some web pages to see the graph")
             return
         
-        # Calculate node positions in a circle if not already set
-        center_x = self.width() / 2
-        center_y = self.height() / 2
-        radius = min(self.width(), self.height()) / 3
-        
-        tab_indices = list(tabs.keys())
-        for i, idx in enumerate(tab_indices):
-            if idx not in self.node_positions:
-                angle = 2 * math.pi * i / len(tab_indices)
-                x = center_x + radius * math.cos(angle)
-                y = center_y + radius * math.sin(angle)
-                self.node_positions[idx] = (x, y)
-        
-        # Remove positions for closed tabs
-        for idx in list(self.node_positions.keys()):
-            if idx not in tabs:
-                del self.node_positions[idx]
+        # Layout only has work to do when the tab snapshot changed
+        if tabs is not self._laid_out_tabs:
+            # Calculate node positions in a circle if not already set
+            self._initial_layout(list(tabs))
+
+            # Remove positions for closed tabs (every open tab has a row by now)
+            if len(self._row_to_idx) != len(tabs):
+                self._keep_nodes(tabs)
+            self._laid_out_tabs = tabs
         
         # Save the transform state
         painter.save()
         
         # Apply zoom and pan transformations
-        painter.translate(self.offset_x, self.offset_y)
-        painter.scale(self.zoom, self.zoom)
+        painter.setTransform(self._xform, True)
         
+        # Recompute edges, clusters and centrality only when the graph changed
+        if self.browser._edges_dirty:
+            self.browser._edges_dirty = False
+            self.rebuild_graph_state(tabs, list(tabs))
+
+        # Graph-space bounds of the dirty area; anything fully outside it is skipped
+        view = self._visible_graph_rect(dirty)
+
         # Draw edges (connections between tabs)
-        # Draw edges (connections between tabs)
-        self.draw_edges(painter, tabs, tab_indices)
+        self.draw_edges(painter, view)
         
         # Clear close button positions from previous frame
         self.close_button_positions = {}
 
         # Draw nodes
-        # Compute clustering based on current similarities
-        try:
-            self.cluster_map = self.compute_clusters(tabs, tab_indices, threshold=self.cluster_threshold)
-        except Exception:
-            self.cluster_map = {}
-
-        # Identify central nodes using MST
-        central_nodes = set()
-        if self.mst_result and self.cluster_map:
-            cluster_central = self.mst_calculator.get_cluster_central_nodes(
-                self.mst_result, self.cluster_map, top_n_per_cluster=10  # Get all nodes
-            )
-            for cluster_id, nodes_scores in cluster_central.items():
-                if not nodes_scores or len(nodes_scores) < 2:
-                    continue
-                # Only highlight as central if there's a clear difference in centrality
-                # Check if top node has significantly higher score than second node
-                top_score = nodes_scores[0][1]
-                second_score = nodes_scores[1][1] if len(nodes_scores) > 1 else 0.0
-
-                # Only highlight if the top score is at least 2% higher than second
-                # This avoids highlighting in cases where all nodes are equal
-                if top_score > second_score * 1.02:
-                    central_nodes.add(nodes_scores[0][0])
+        central_nodes = self._central_nodes
 
         # Track hovered node for drawing full title on top later
         hovered_node_data = None
 
-        for idx, (x, y) in self.node_positions.items():
+        # Labels are rendered at the current device scale so zooming in stays crisp
+        sprite_scale = self._sprite_scale()
+        # Node sprites are rendered at (nearly) the exact zoom and blitted 1:1
+        # in device pixels, so no node needs a scaled draw
+        node_scale = self._node_sprite_scale()
+        dpr = self.devicePixelRatioF()
+        node_sprites = []
+
+        # Cull nodes whose body (radius + shadow + inline label) can't reach the viewport
+        left, top, right, bottom = view
+        margin = self.node_cull_margin
+        visible = ((self._xs > left - margin) & (self._xs < right + margin) &
+                   (self._ys > top - margin) & (self._ys < bottom + margin))
+        if self.hovered_node in self._idx_to_row:
+            visible[self._idx_to_row[self.hovered_node]] = True
+        rows = np.flatnonzero(visible).tolist()
+        xs = self._xs[rows].tolist()
+        ys = self._ys[rows].tolist()
+
+        # Pass 1: shadow + node circle, blitted from the cached sprites
+        nodes = []
+        hovered = None
+        for row, x, y in zip(rows, xs, ys):
+            idx = self._row_to_idx[row]
             tab_data = tabs[idx]
 
             # Check if this is a central node
@@ -168,14 +306,7 @@ class GraphView(QWidget):
             if idx == self.hovered_node:
                 # Slightly smaller hovered radius while still fitting the title
                 radius = 75;
-                # Clean blue gradient (hovered) - Chrome-like
-                gradient = QRadialGradient(x, y, radius)
-                gradient.setColorAt(0, QColor(100, 160, 255))
-                gradient.setColorAt(0.7, QColor(66, 133, 244))
-                gradient.setColorAt(1, QColor(50, 110, 200))
-                node_brush = QBrush(gradient)
-                border_color = QColor(66, 133, 244)
-                border_width = 2.5
+                sprite = self._node_sprite(None, False, True, radius, node_scale)
             else:
                 # Central nodes are larger
                 radius = 85 if is_central else 70
@@ -187,140 +318,115 @@ class GraphView(QWidget):
                         self.cluster_colors[cluster_id] = QColor.fromHsv(hue, 180, 245)
                     base_color = self.cluster_colors[cluster_id]
                 else:
-                    base_color = QColor(245, 247, 250)
-
-                # Brighter gradient for central nodes
-                if is_central:
-                    gradient = QRadialGradient(x, y, radius)
-                    gradient.setColorAt(0, base_color.lighter(135))
-                    gradient.setColorAt(0.7, base_color.lighter(115))
-                    gradient.setColorAt(1, base_color.darker(105))
-                    node_brush = QBrush(gradient)
-                    border_color = base_color.darker(130)
-                    border_width = 3.5
-                else:
-                    # Subtle radial gradient tinted by cluster color
-                    gradient = QRadialGradient(x, y, radius)
-                    gradient.setColorAt(0, base_color.lighter(120))
-                    gradient.setColorAt(0.8, base_color.lighter(105))
-                    gradient.setColorAt(1, base_color.darker(110))
-                    node_brush = QBrush(gradient)
-                    border_color = base_color.darker(120)
-                    border_width = 2
-
-            # Soft shadow (not glow)
-            painter.setBrush(QBrush(QColor(0, 0, 0, 20)))
-            painter.setPen(QPen(Qt.NoPen))
-            painter.drawEllipse(QPointF(x + 2, y + 3), radius + 2, radius + 2)
-
-            # Node circle
-            painter.setBrush(node_brush)
-            painter.setPen(QPen(border_color, border_width))
-            painter.drawEllipse(QPointF(x, y), radius, radius)
-
-            # Draw favicon in center of node (shift up a bit to leave room for label)
-            if 'icon' in tab_data and not tab_data['icon'].isNull():
+                    base_color = self._default_node_color
+                sprite = self._node_sprite(base_color, is_central, False, radius, node_scale)
+            node_sprites.append((sprite, x, y))
+
+            node = (idx, tab_data, x, y, radius)
+            nodes.append(node)
+            if idx == self.hovered_node:
+                hovered = node
+
+        painter.save()
+        painter.resetTransform()
+        zoom = self.zoom
+        for sprite, x, y in node_sprites:
+            # Centre on the node's widget position, snapped to a device pixel
+            half = sprite.width() / 2
+            painter.drawPixmap(QPointF(round((x * zoom + self.offset_x) * dpr - half) / dpr,
+                                       round((y * zoom + self.offset_y) * dpr - half) / dpr),
+                               sprite)
+        painter.restore()
+
+        # Pass 2: favicon in center of node (shift up a bit to leave room for label)
+        for idx, tab_data, x, y, radius in nodes:
+            icon = tab_data['icon']
+            if not icon.isNull():
                 # Scale favicon sizes down to match slightly smaller nodes
                 icon_size = 48 if idx == self.hovered_node else 44
-                pixmap = tab_data['icon'].pixmap(QSize(icon_size, icon_size))
+                pixmap = self._favicon_pixmap(icon, icon_size)
                 # Move favicon up more so the inline label can sit lower inside the node
                 painter.drawPixmap(
-                    int(x - icon_size / 2),
-                    int(y - icon_size / 2 - 16),  # Move up to make room for label below
+                    QPointF(x - icon_size / 2,
+                            y - icon_size / 2 - 16),  # Move up to make room for label below
                     pixmap
                 )
 
-            # Small truncated label inside the node
-            try:
-                label = tab_data.get('title', '')
-                # Prefer web view's title if available (full title fetched for hover)
-                widget = tab_data.get('widget')
-                if widget is not None and hasattr(widget, 'web_view'):
-                    wtitle = widget.web_view.title()
-                    if wtitle:
-                        label = wtitle
-            except Exception:
-                label = tab_data.get('title', '')
+        # Pass 3: small truncated label inside the node
+        for idx, tab_data, x, y, radius in nodes:
+            label = self._tab_full_title(tab_data)
 
             # Truncate to a short inline label (12 chars) for compact display
             short_label = label[:12] + '…' if len(label) > 12 else label
-            painter.setFont(QFont('SF Pro Display', 9, QFont.Normal))
-            painter.setPen(QPen(QColor(60, 64, 67)))
-            txt_rect = painter.boundingRect(0, 0, int(radius * 1.4), 18, Qt.AlignCenter, short_label)
+            label_pixmap, label_w, label_h = self._node_label_pixmap(
+                short_label, int(radius * 1.4), sprite_scale)
             # Position the inline label inside the node (lower than center but still contained)
-            txt_rect.moveCenter(QPointF(x, y + radius * 0.35).toPoint())
-            painter.drawText(txt_rect, Qt.AlignCenter, short_label)
-
-            # Save full title from web view (for hover overlay)
-            full_title = tab_data.get('title', '')
-            try:
-                if widget is not None and hasattr(widget, 'web_view'):
-                    wtitle = widget.web_view.title()
-                    if wtitle:
-                        full_title = wtitle
-            except Exception:
-                pass
+            painter.drawPixmap(
+                QPointF(x - label_w / 2, y + radius * 0.35 - label_h / 2),
+                label_pixmap
+            )
 
             if idx == self.hovered_node:
                 hovered_node_data = {
                     'x': x,
                     'y': y,
                     'radius': radius,
-                    'title': full_title
+                    'title': label
                 }
 
-            # Draw close button when hovered
-            if idx == self.hovered_node:
-                # Place the close button slightly outside the node at the top-right
-                # so it visually sits just outside the circle with a small overlap.
-                # offset factor > 1 would place it further out; 0.75 keeps it near
-                # the edge but slightly outside along the diagonal.
-                # Keep the close button slightly outside the node at the top-right
-                close_btn_offset_factor = 0.75
-                close_btn_x = x + radius * close_btn_offset_factor
-                close_btn_y = y - radius * close_btn_offset_factor
-                # Slightly smaller close button to match reduced node size
-                close_btn_radius = 14
-
-                # Close button background
-                painter.setBrush(QBrush(QColor(220, 53, 69)))
-                painter.setPen(QPen(QColor(200, 40, 55), 1))
-                painter.drawEllipse(QPointF(close_btn_x, close_btn_y), close_btn_radius, close_btn_radius)
-
-                # X symbol (centered in the close button)
-                painter.setPen(QPen(QColor(255, 255, 255), 2))
-                offset = max(4, int(close_btn_radius * 0.45))
-                painter.drawLine(
-                    int(close_btn_x - offset), int(close_btn_y - offset),
-                    int(close_btn_x + offset), int(close_btn_y + offset)
-                )
-                painter.drawLine(
-                    int(close_btn_x + offset), int(close_btn_y - offset),
-                    int(close_btn_x - offset), int(close_btn_y + offset)
-                )
-
-                # Store close button position for click detection
-                self.close_button_positions[idx] = (close_btn_x, close_btn_y, close_btn_radius)
-
-                # Show URL tooltip on hover
-                url = tab_data['url']
-                if len(url) > 60:
-                    url = url[:60] + '...'
-
-                # Draw tooltip
-                tooltip_font = QFont('SF Pro Display', 9)
-                painter.setFont(tooltip_font)
-                tooltip_rect = painter.boundingRect(0, 0, 400, 30, Qt.AlignLeft, url)
-                tooltip_rect.moveCenter(QPointF(x, y - radius - 35).toPoint())
-
-                # Tooltip background
-                painter.setBrush(QBrush(QColor(50, 55, 60, 240)))
-                painter.setPen(QPen(Qt.NoPen))
-                painter.drawRoundedRect(tooltip_rect.adjusted(-10, -5, 10, 5), 5, 5)
-
-                # Tooltip text
-                painter.setPen(QPen(QColor(240, 245, 250)))
-                painter.drawText(tooltip_rect, Qt.AlignCenter, url)
+        # Close button and URL tooltip for the hovered node, on top of every node
+        if hovered is not None:
+            idx, tab_data, x, y, radius = hovered
+
+            # Place the close button slightly outside the node at the top-right
+            # so it visually sits just outside the circle with a small overlap.
+            # offset factor > 1 would place it further out; 0.75 keeps it near
+            # the edge but slightly outside along the diagonal.
+            close_btn_offset_factor = 0.75
+            close_btn_x = x + radius * close_btn_offset_factor
+            close_btn_y = y - radius * close_btn_offset_factor
+            # Slightly smaller close button to match reduced node size
+            close_btn_radius = 14
+
+            # Close button background
+            painter.setBrush(self._close_brush)
+            painter.setPen(self._close_pen)
+            painter.drawEllipse(QPointF(close_btn_x, close_btn_y), close_btn_radius, close_btn_radius)
+
+            # X symbol (centered in the close button)
+            painter.setPen(self._white_pen)
+            offset = max(4, int(close_btn_radius * 0.45))
+            painter.drawLines([
+                QLineF(close_btn_x - offset, close_btn_y - offset,
+                       close_btn_x + offset, close_btn_y + offset),
+                QLineF(close_btn_x + offset, close_btn_y - offset,
+                       close_btn_x - offset, close_btn_y + offset),
+            ])
+
+            # Store close button position for click detection
+            self.close_button_positions[idx] = (close_btn_x, close_btn_y, close_btn_radius)
+
+            # Show URL tooltip on hover
+            url = tab_data['url']
+            if len(url) > 60:
+                url = url[:60] + '...'
+
+            # Draw tooltip
+            painter.setFont(self._font_small)
+            if self._tooltip_rect is None or self._tooltip_rect[0] != url:
+                # Measured once per hovered URL rather than shaped on every frame
+                self._tooltip_rect = (url, self._fm_small.boundingRect(QRect(0, 0, 400, 30), Qt.AlignLeft, url))
+            tooltip_rect = QRect(self._tooltip_rect[1])
+            tooltip_rect.moveCenter(QPointF(x, y - radius - 35).toPoint())
+
+            # Tooltip background
+            painter.setBrush(self._tooltip_brush)
+            painter.setPen(self._no_pen)
+            painter.drawRoundedRect(tooltip_rect.adjusted(-10, -5, 10, 5), 5, 5)
+
+            # Tooltip text
+            painter.setPen(self._tooltip_pen)
+            painter.drawText(tooltip_rect, Qt.AlignCenter, url)
 
         # Hover overlay will be drawn in screen coordinates after restore
 
@@ -331,74 +437,27 @@ class GraphView(QWidget):
         # and wrapping are measured against widget pixels (avoids issues
         # when zoom/pan transforms are active).
         if hovered_node_data:
-            from PyQt5.QtCore import QRectF
-            from PyQt5.QtGui import QTextDocument
-
             # Convert graph coordinates to screen coordinates (apply zoom & pan)
             gx = hovered_node_data['x']
             gy = hovered_node_data['y']
             radius = hovered_node_data['radius']
             full_title = hovered_node_data['title']
 
-            sx = gx * self.zoom + self.offset_x
-            sy = gy * self.zoom + self.offset_y
-
-            font = QFont('SF Pro Display', 14, QFont.Bold)
-
-            # Use QTextDocument for proper text layout with word wrapping
-            max_chars = 200
-            display_title = full_title if len(full_title) <= max_chars else full_title[:max_chars] + "…"
-
-            doc = QTextDocument()
-            doc.setDefaultFont(font)
-            html_text = f'<div style="color: rgb(60, 64, 67); text-align: center;">{display_title}</div>'
-            doc.setHtml(html_text)
-
-            # Measure natural width (no constraint) using font metrics for accuracy
-            fm = QFontMetrics(font)
-            natural_width = fm.horizontalAdvance(display_title)
+            screen = self._xform.map(QPointF(gx, gy))
 
-            # Safe maximum (60% of widget width, cap at 800px)
-            safe_max = min(800, int(self.width() * 0.6))
-
-            if natural_width > safe_max:
-                # Constrain document to safe_max so it wraps
-                doc.setTextWidth(safe_max)
-                text_size = doc.size()
-                text_width = text_size.width()
-                text_height = text_size.height()
-            else:
-                # Use measured natural width; set doc width to that to get height
-                doc.setTextWidth(natural_width)
-                text_size = doc.size()
-                text_width = text_size.width()
-                text_height = text_size.height()
-
-            # Position the popup centered below the node in screen coords
-            text_rect = QRectF(
-                sx - text_width / 2,
-                sy + radius + 12,
-                text_width,
-                text_height
-            )
-
-            # Ensure popup stays within widget bounds horizontally
-            if text_rect.left() < 8:
-                text_rect.moveLeft(8)
-            if text_rect.right() > self.width() - 8:
-                text_rect.moveRight(self.width() - 8)
+            doc, text_rect = self._layout_hover_title(screen.x(), screen.y(), radius, full_title)
 
             # Draw shadow + background + border
-            painter.setBrush(QBrush(QColor(0, 0, 0, 40)))
-            painter.setPen(QPen(Qt.NoPen))
+            painter.setBrush(self._popup_shadow_brush)
+            painter.setPen(self._no_pen)
             painter.drawRoundedRect(text_rect.adjusted(-8, -3, 14, 9), 8, 8)
 
-            painter.setBrush(QBrush(QColor(255, 255, 255, 250)))
-            painter.setPen(QPen(QColor(66, 133, 244), 2))
+            painter.setBrush(self._popup_brush)
+            painter.setPen(self._popup_pen)
             painter.drawRoundedRect(text_rect.adjusted(-10, -5, 10, 5), 8, 8)
 
             # Draw the text
-            painter.setPen(QPen(QColor(60, 64, 67)))
+            painter.setPen(self._text_pen)
             painter.save()
             painter.translate(text_rect.topLeft())
             doc.drawContents(painter)
@@ -412,24 +471,29 @@ class GraphView(QWidget):
             panel_h = self.height() - panel_margin * 2
             panel_w = panel_width
 
-            # Panel background
             panel_rect = QRect(panel_x, panel_y, panel_w, panel_h)
             self._panel_rect = panel_rect
 
-            painter.setPen(QPen(QColor(200, 205, 210), 1))
-            painter.setBrush(QBrush(QColor(255, 255, 255, 250)))
-            painter.drawRoundedRect(panel_rect, 8, 8)
-
             # Close button at top-right of panel
             close_r = 12
             close_x = panel_x + panel_w - close_r - 10
             close_y = panel_y + 10
             self._close_btn_rect = QRect(close_x - close_r, close_y - close_r, close_r*2, close_r*2)
 
-            painter.setBrush(QBrush(QColor(230, 80, 80)))
-            painter.setPen(QPen(QColor(200, 40, 40)))
+            # Repaints that don't reach the panel (hover, moving nodes) skip
+            # its text layout; the rects above are still kept for clicks
+            if not dirty.intersects(panel_rect.adjusted(-2, -2, 2, 2)):
+                return
+
+            # Panel background
+            painter.setPen(self._panel_pen)
+            painter.setBrush(self._panel_brush)
+            painter.drawRoundedRect(panel_rect, 8, 8)
+
+            painter.setBrush(self._panel_close_brush)
+            painter.setPen(self._panel_close_pen)
             painter.drawEllipse(self._close_btn_rect)
-            painter.setPen(QPen(QColor(255, 255, 255), 2))
+            painter.setPen(self._white_pen)
             painter.drawLine(close_x - 5, close_y - 5, close_x + 5, close_y + 5)
             painter.drawLine(close_x + 5, close_y - 5, close_x - 5, close_y + 5)
 
@@ -438,19 +502,23 @@ class GraphView(QWidget):
             desc = self.get_cluster_description(self.selected_cluster)
 
             # Draw cluster color indicator (circle next to title)
-            cluster_color = self.cluster_colors.get(self.selected_cluster, QColor(180, 180, 180))
+            cluster_color = self.cluster_colors.get(self.selected_cluster, self._panel_default_color)
             indicator_size = 14
             indicator_x = panel_x + 16
             indicator_y = panel_y + 26
 
             # Draw color indicator with border
-            painter.setPen(QPen(cluster_color.darker(120), 2))
-            painter.setBrush(QBrush(cluster_color))
+            indicator_style = self._indicator_styles.get(cluster_color.rgba())
+            if indicator_style is None:
+                indicator_style = (QPen(cluster_color.darker(120), 2), QBrush(cluster_color))
+                self._indicator_styles[cluster_color.rgba()] = indicator_style
+            painter.setPen(indicator_style[0])
+            painter.setBrush(indicator_style[1])
             painter.drawEllipse(indicator_x, indicator_y, indicator_size, indicator_size)
 
             # Draw title (shifted right to make room for indicator)
-            painter.setPen(QPen(QColor(34, 40, 49)))
-            painter.setFont(QFont('SF Pro Display', 12, QFont.Bold))
+            painter.setPen(self._panel_title_pen)
+            painter.setFont(self._font_panel_title)
             title_rect = QRect(panel_x + 16 + indicator_size + 8, panel_y + 20, panel_w - 40 - indicator_size - 8, 30)
             painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignVCenter, title)
 
@@ -463,7 +531,7 @@ class GraphView(QWidget):
 
             tags_height = 0
             if tags:
-                painter.setFont(QFont('SF Pro Display', 9))
+                painter.setFont(self._font_small)
                 fm = painter.fontMetrics()
                 chip_x = panel_x + 16
                 chip_y = panel_y + 52
@@ -479,10 +547,10 @@ class GraphView(QWidget):
                         chip_y += line_height + 6
 
                     chip_rect = QRect(int(chip_x), int(chip_y), int(chip_w), fm.height() + 6)
-                    painter.setBrush(QBrush(QColor(245, 246, 248)))
-                    painter.setPen(QPen(QColor(210, 215, 220)))
+                    painter.setBrush(self._chip_brush)
+                    painter.setPen(self._chip_pen)
                     painter.drawRoundedRect(chip_rect, 6, 6)
-                    painter.setPen(QPen(QColor(60, 64, 67)))
+                    painter.setPen(self._text_pen)
                     painter.drawText(chip_rect, Qt.AlignCenter, t)
 
                     chip_x += chip_w + 8
@@ -490,107 +558,403 @@ class GraphView(QWidget):
                 tags_height = (chip_y - (panel_y + 52)) + line_height
 
             # Draw description (positioned below tags area)
-            painter.setFont(QFont('SF Pro Display', 10))
-            painter.setPen(QPen(QColor(70, 76, 82)))
+            painter.setFont(self._font_panel_desc)
+            painter.setPen(self._panel_desc_pen)
             desc_y = panel_y + 60 + max(0, tags_height)
             desc_rect = QRect(panel_x + 16, desc_y, panel_w - 40, panel_h - (desc_y - panel_y) - 20)
             painter.drawText(desc_rect, Qt.TextWordWrap, desc)
     
+    def _layout_hover_title(self, sx, sy, radius, full_title):
+        """Lay out the hovered node's full-title popup in screen coordinates.
+
+        Returns (QTextDocument, QRectF) so paintEvent and the hover dirty-region
+        computation agree on where the popup goes.
+        """
+        # Use QTextDocument for proper text layout with word wrapping
+        max_chars = 200
+        display_title = full_title if len(full_title) <= max_chars else full_title[:max_chars] + "…"
+
+        # Safe maximum (60% of widget width, cap at 800px)
+        safe_max = min(800, int(self.width() * 0.6))
+
+        # The same popup is laid out on every repaint while hovering; reuse it
+        key = (display_title, safe_max)
+        cached = self._hover_title_layout
+        if cached is not None and cached[0] == key:
+            _, doc, text_width, text_height = cached
+        else:
+            doc = QTextDocument()
+            doc.setDefaultFont(self._font_hover_title)
+            html_text = f'<div style="color: rgb(60, 64, 67); text-align: center;">{display_title}</div>'
+            doc.setHtml(html_text)
+
+            # Measure natural width (no constraint) using font metrics for accuracy
+            natural_width = self._fm_hover_title.horizontalAdvance(display_title)
+
+            if natural_width > safe_max:
+                # Constrain document to safe_max so it wraps
+                doc.setTextWidth(safe_max)
+            else:
+                # Use measured natural width; set doc width to that to get height
+                doc.setTextWidth(natural_width)
+            text_size = doc.size()
+            text_width = text_size.width()
+            text_height = text_size.height()
+            self._hover_title_layout = (key, doc, text_width, text_height)
+
+        # Position the popup centered below the node in screen coords
+        text_rect = QRectF(
+            sx - text_width / 2,
+            sy + radius + 12,
+            text_width,
+            text_height
+        )
+
+        # Ensure popup stays within widget bounds horizontally
+        if text_rect.left() < 8:
+            text_rect.moveLeft(8)
+        if text_rect.right() > self.width() - 8:
+            text_rect.moveRight(self.width() - 8)
+
+        return doc, text_rect
+
+    def _tab_full_title(self, tab_data):
+        """Return the page title, preferring the untruncated one from titleChanged"""
+        return tab_data.get('full_title') or tab_data.get('title', '')
+
+    def _hover_region(self, idx):
+        """Screen region touched by hovering node idx (node, tooltip, popup, incident edges)"""
+        region = QRegion()
+        if idx is None or idx not in self._idx_to_row:
+            return region
+
+        row = self._idx_to_row[idx]
+        x, y = self._node_xy(idx)
+        # Node body with shadow and close button, plus the URL tooltip above it
+        rects = [QRectF(x - 210, y - 140, 420, 235)]
+        # Incident edges bow out by up to 50px and carry a score label
+        r1, r2 = self._edge_row_arrays()
+        incident = (r1 == row) | (r2 == row)
+        if incident.any():
+            xs1 = self._xs[r1[incident]]
+            ys1 = self._ys[r1[incident]]
+            xs2 = self._xs[r2[incident]]
+            ys2 = self._ys[r2[incident]]
+            for left, top, right, bottom in zip(np.minimum(xs1, xs2).tolist(), np.minimum(ys1, ys2).tolist(),
+                                                np.maximum(xs1, xs2).tolist(), np.maximum(ys1, ys2).tolist()):
+                rects.append(QRectF(left, top, right - left, bottom - top).adjusted(-60, -60, 60, 60))
+        for rect in rects:
+            region = region.united(self._xform.mapRect(rect).toAlignedRect())
+
+        # Full-title popup is laid out in screen coordinates below the node
+        tab_data = self.get_tabs().get(idx)
+        if tab_data is not None:
+            screen = self._xform.map(QPointF(x, y))
+            _, text_rect = self._layout_hover_title(screen.x(), screen.y(), 75, self._tab_full_title(tab_data))
+            region = region.united(text_rect.adjusted(-10, -5, 14, 9).toAlignedRect())
+        return region
+
+    def get_tabs(self):
+        """Return the cached web tab snapshot, rebuilding it only when invalidated"""
+        if self._tabs is None:
+            self._tabs = self.browser.get_web_tabs()
+        return self._tabs
+
+    def invalidate_tabs(self, wake=True):
+        """Drop the cached tab snapshot so the next paint re-reads the browser;
+        wake=False leaves a settled layout asleep (e.g. while the view is hidden)"""
+        self._tabs = None
+        self._laid_out_tabs = None
+        if wake:
+            self.wake_physics()
+
+    def wake_physics(self):
+        """Restart the physics timer if the layout had settled and stopped it"""
+        self._settled_ticks = 0
+        if self.physics_enabled and not self._physics_timer.isActive():
+            self._physics_timer.start(self.physics_interval_ms)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.wake_physics()
+
     def get_node_at_pos(self, screen_x, screen_y):
         """Get node index at screen position, accounting for zoom and pan"""
         # Transform screen coordinates to graph coordinates
-        graph_x = (screen_x - self.offset_x) / self.zoom
-        graph_y = (screen_y - self.offset_y) / self.zoom
+        graph_x, graph_y = self._to_graph(screen_x, screen_y)
         
-        for idx, (x, y) in self.node_positions.items():
-            distance = math.sqrt((graph_x - x)**2 + (graph_y - y)**2)
-            if distance <= 116:  # Max node radius (updated to match larger nodes)
-                return idx
+        if not self._row_to_idx:
+            return None
+
+        # Nearest node by squared distance, vectorized over all rows
+        d2 = (self._xs - graph_x) ** 2 + (self._ys - graph_y) ** 2
+        row = int(np.argmin(d2))
+        if d2[row] <= self.hit_radius * self.hit_radius:
+            return self._row_to_idx[row]
         return None
 
-    def draw_edges(self, painter, tabs, tab_indices, threshold=0.20):
-        """Draw edges between nodes when similarity exceeds threshold.
+    def _node_xy(self, idx):
+        """Graph-space (x, y) of node idx"""
+        row = self._idx_to_row[idx]
+        return float(self._xs[row]), float(self._ys[row])
+
+    def _set_node_xy(self, idx, x, y):
+        """Move node idx to graph-space (x, y)"""
+        row = self._idx_to_row[idx]
+        self._xs[row] = x
+        self._ys[row] = y
+        self._layout_version += 1
+
+    def _keep_nodes(self, tabs):
+        """Drop the rows of nodes whose tab is no longer open"""
+        rows = [row for row, idx in enumerate(self._row_to_idx) if idx in tabs]
+        self._xs = self._xs[rows]
+        self._ys = self._ys[rows]
+        self._vxs = self._vxs[rows]
+        self._vys = self._vys[rows]
+        self._fxs = self._fys = None
+        self._unpainted_dx = self._unpainted_dy = None
+        self._layout_version += 1
+        self._row_to_idx = [self._row_to_idx[row] for row in rows]
+        self._idx_to_row = {idx: row for row, idx in enumerate(self._row_to_idx)}
+
+    def _initial_layout(self, tab_indices):
+        """Place nodes that have no position yet on a circle around the view centre."""
+        slots = [i for i, idx in enumerate(tab_indices) if idx not in self._idx_to_row]
+        if not slots:
+            return
+
+        center_x = self.width() / 2
+        center_y = self.height() / 2
+        radius = min(self.width(), self.height()) / 3
+
+        # Each node keeps its slot on the circle of all len(tab_indices) nodes
+        angles = np.asarray(slots, dtype=float) * (2 * np.pi / len(tab_indices))
+        xs = center_x + radius * np.cos(angles)
+        ys = center_y + radius * np.sin(angles)
+
+        for i in slots:
+            self._idx_to_row[tab_indices[i]] = len(self._row_to_idx)
+            self._row_to_idx.append(tab_indices[i])
+        self._xs = np.concatenate((self._xs, xs))
+        self._ys = np.concatenate((self._ys, ys))
+        self._vxs = np.concatenate((self._vxs, np.zeros(len(slots))))
+        self._vys = np.concatenate((self._vys, np.zeros(len(slots))))
+        self._fxs = self._fys = None
+        self._unpainted_dx = self._unpainted_dy = None
+        self._layout_version += 1
+
+    def rebuild_graph_state(self, tabs, tab_indices):
+        """Recompute edges, clusters, the MST and central nodes for the current tabs.
 
-        painter: QPainter already transformed for pan/zoom
         tabs: dict mapping tab index -> {'title', 'url', 'widget'}
         tab_indices: list of tab indices in display order
-        threshold: similarity cutoff (0..1)
+
+        Only called when the browser marks the graph dirty, so repaints during
+        hover, drag and pan just iterate the cached results.
         """
-        if not tab_indices or len(tab_indices) < 2:
-            return
+        # Look every pair up once; clustering, edges and physics reuse the result
+        sims = self.browser.get_similarity_matrix(tab_indices)
+        self._sim_matrix = sims
+        self._sim_order = {idx: k for k, idx in enumerate(tab_indices)}
+        self._sim_tabs = tabs
 
-        if self.show_mst_only:
-            # Build edges for MST calculation
-            edges = []
-            for i, idx1 in enumerate(tab_indices):
-                for idx2 in tab_indices[i+1:]:
-                    try:
-                        similarity = self.browser.calculate_similarity(
-                            tabs[idx1]['url'], tabs[idx2]['url']
-                        )
-                    except Exception as e:
-                        similarity = 0.0
+        # Compute clustering based on current similarities
+        try:
+            self.cluster_map = self.compute_clusters(tabs, tab_indices, threshold=self.cluster_threshold, sims=sims)
+        except Exception:
+            self.cluster_map = {}
 
-                    if similarity > threshold:
-                        edges.append(Edge(idx1, idx2, similarity))
+        # Collect every edge above the drawing threshold with its visual style
+        min_width = 1.5
+        max_width = 4
+        iu, ju = np.nonzero(np.triu(sims > self.edge_threshold, k=1))
+        weights = sims[iu, ju]
+        # Smoother thickness scaling - less variation
+        thicknesses = min_width + (max_width - min_width) * weights
+        # More subtle alpha for less clutter
+        alphas = np.clip(60 + weights * 100, 0, 255).astype(int)  # 60-160 range
+        edges = [
+            (tab_indices[i], tab_indices[j], similarity, thickness, alpha)
+            for i, j, similarity, thickness, alpha in zip(
+                iu.tolist(), ju.tolist(), weights.tolist(),
+                thicknesses.tolist(), alphas.tolist())
+        ]
+        self._edges = edges
+
+        self.mst_result = None
+        self._drawn_edges = edges
+        if self.show_mst_only and len(tab_indices) >= 2:
+            weighted = [Edge(idx1, idx2, similarity) for idx1, idx2, similarity, _, _ in edges]
 
             # Calculate MST (but use full graph for centrality)
             self.mst_result = self.mst_calculator.calculate_mst(
-                tab_indices, edges, self.cluster_map
+                tab_indices, weighted, self.cluster_map
             )
 
             # Calculate centrality based on full graph, not just MST
             full_graph_centrality = self.mst_calculator._calculate_centrality(
-                tab_indices, edges  # Use ALL edges, not just MST
+                tab_indices, weighted  # Use ALL edges, not just MST
             )
             # Override the MST-based centrality with full graph centrality
             self.mst_result.node_centrality = full_graph_centrality
 
             # Draw only MST edges
-            for edge in self.mst_result.edges:
-                self._draw_edge(painter, edge.node1, edge.node2, edge.weight)
-        else:
-            # Draw all edges above threshold
-            for i, idx1 in enumerate(tab_indices):
-                for idx2 in tab_indices[i+1:]:
-                    try:
-                        similarity = self.browser.calculate_similarity(
-                            tabs[idx1]['url'], tabs[idx2]['url']
-                        )
-                    except Exception as e:
-                        similarity = 0.0
+            styles = {(idx1, idx2): (thickness, alpha) for idx1, idx2, _, thickness, alpha in edges}
+            self._drawn_edges = [
+                (edge.node1, edge.node2, edge.weight) + styles[(edge.node1, edge.node2)]
+                for edge in self.mst_result.edges
+            ]
+
+        # Identify central nodes using MST
+        central_nodes = set()
+        if self.mst_result and self.cluster_map:
+            cluster_central = self.mst_calculator.get_cluster_central_nodes(
+                self.mst_result, self.cluster_map, top_n_per_cluster=10  # Get all nodes
+            )
+            for cluster_id, nodes_scores in cluster_central.items():
+                if not nodes_scores or len(nodes_scores) < 2:
+                    continue
+                # Only highlight as central if there's a clear difference in centrality
+                # Check if top node has significantly higher score than second node
+                top_score = nodes_scores[0][1]
+                second_score = nodes_scores[1][1] if len(nodes_scores) > 1 else 0.0
+
+                # Only highlight if the top score is at least 2% higher than second
+                # This avoids highlighting in cases where all nodes are equal
+                if top_score > second_score * 1.02:
+                    central_nodes.add(nodes_scores[0][0])
+        self._central_nodes = central_nodes
 
-                    if similarity > threshold:
-                        self._draw_edge(painter, idx1, idx2, similarity)
+    def draw_edges(self, painter, view=None):
+        """Draw the cached edges (MST only or all above threshold).
 
-    def _draw_edge(self, painter, idx1, idx2, weight):
-        """Helper method to draw a single edge between two nodes.
+        Edges sharing a pen are appended to one QPainterPath and stroked with a
+        single drawPath, so the pen changes once per bucket instead of per edge.
+        The paths are kept until the layout, hover, zoom or view changes, so
+        repaints of a settled graph skip the curve geometry entirely.
 
         painter: QPainter already transformed for pan/zoom
-        idx1, idx2: node indices
-        weight: edge weight (similarity score 0..1)
+        view: optional graph-space (left, top, right, bottom); edges whose
+              bounding box lies entirely outside it are skipped
         """
-        x1, y1 = self.node_positions[idx1]
-        x2, y2 = self.node_positions[idx2]
+        state = (self._layout_version, self.hovered_node, self.zoom, view)
+        cached = self._edge_paths
+        if cached is not None and cached[0] is self._drawn_edges and cached[1] == state:
+            strokes, labels = cached[2:]
+        else:
+            strokes, labels = self._edge_strokes(view)
+            self._edge_paths = (self._drawn_edges, state, strokes, labels)
 
-        # Smoother thickness scaling - less variation
-        min_width = 1.5
-        max_width = 4
-        thickness = min_width + (max_width - min_width) * weight
+        for pen, path in strokes:
+            painter.setPen(pen)
+            painter.drawPath(path)
 
-        # More subtle alpha for less clutter
-        alpha = int(60 + weight * 100)  # 60-160 range
+        if labels:
+            scale = self._sprite_scale()
+            for mid_x, mid_y, weight in labels:
+                pixmap, ascent = self._edge_label_pixmap(weight, scale)
+                # Text baseline sits 5px above the edge midpoint
+                painter.drawPixmap(QPointF(mid_x, mid_y - 5 - ascent), pixmap)
 
-        # Modern browser-inspired blue colors
-        if self.hovered_node in (idx1, idx2):
-            # Bright blue when hovered (Chrome blue)
-            color = QColor(66, 133, 244, alpha + 60)
+    def _edge_strokes(self, view):
+        """Build the edge paths for draw_edges.
+
+        Returns ([(pen, path)] in stroke order, [(mid_x, mid_y, weight)] score labels)
+        """
+        paths = defaultdict(QPainterPath)
+        pens = {}
+        labels = []
+        edges = self._drawn_edges
+        kept, r1, r2, weights = self._edge_arrays()
+        # Zoomed out, the weakest edges are thin faint lines that can't be told
+        # apart; raise the cutoff for them (hovered edges are always drawn)
+        min_weight = self.edge_threshold + 0.2 * max(0.0, 1.0 - self.zoom)
+        # Score labels are unreadable below this zoom
+        show_labels = self.zoom >= 0.7
+
+        # Select the edges to draw in one pass over the arrays
+        hovered_row = self._idx_to_row.get(self.hovered_node)
+        if hovered_row is not None:
+            hovered = (r1 == hovered_row) | (r2 == hovered_row)
+            selected = hovered | (weights >= min_weight)
         else:
-            # Subtle gray-blue for normal edges
-            color = QColor(128, 134, 139, alpha)
+            hovered = np.zeros(len(r1), dtype=bool)
+            selected = weights >= min_weight
+        x1s = self._xs[r1]
+        y1s = self._ys[r1]
+        x2s = self._xs[r2]
+        y2s = self._ys[r2]
+        if view is not None:
+            # Curves bow out by at most 50px; leave room for that plus the pen and label
+            left, top, right, bottom = view
+            left -= 60
+            top -= 60
+            right += 60
+            bottom += 60
+            # Trivial reject: both endpoints beyond the same side of the viewport
+            selected &= ~(((x1s < left) & (x2s < left)) | ((x1s > right) & (x2s > right)) |
+                          ((y1s < top) & (y2s < top)) | ((y1s > bottom) & (y2s > bottom)))
+            # Both endpoints off-screen: the segment may still pass the
+            # viewport by a corner without entering it
+            outside = ~((left <= x1s) & (x1s <= right) & (top <= y1s) & (y1s <= bottom)) & \
+                ~((left <= x2s) & (x2s <= right) & (top <= y2s) & (y2s <= bottom))
+        else:
+            outside = np.zeros(len(r1), dtype=bool)
+
+        picked = np.flatnonzero(selected)
+        for k, x1, y1, x2, y2, is_hovered, off_screen in zip(
+                kept[picked].tolist(), x1s[picked].tolist(), y1s[picked].tolist(),
+                x2s[picked].tolist(), y2s[picked].tolist(),
+                hovered[picked].tolist(), outside[picked].tolist()):
+            if off_screen and not self._segment_hits_rect(x1, y1, x2, y2, left, top, right, bottom):
+                continue
+            _, _, weight, thickness, alpha = edges[k]
+
+            key = (is_hovered, alpha)
+            if key not in pens:
+                pens[key] = self._edge_pen(alpha, thickness, is_hovered)
+            mid_x, mid_y = self._add_edge_curve(paths[key], x1, y1, x2, y2)
 
+            # Only show similarity score on hover
+            if is_hovered and show_labels:
+                labels.append((mid_x, mid_y, weight))
+
+        # Sorted so highlighted (hovered) edges are stroked on top
+        return [(pens[key], paths[key]) for key in sorted(paths)], labels
+
+    @staticmethod
+    def _segment_hits_rect(x1, y1, x2, y2, left, top, right, bottom):
+        """Whether the segment (x1, y1)-(x2, y2) crosses the rect (Liang-Barsky clip)"""
+        dx = x2 - x1
+        dy = y2 - y1
+        t0 = 0.0
+        t1 = 1.0
+        for p, q in ((-dx, x1 - left), (dx, right - x1), (-dy, y1 - top), (dy, bottom - y1)):
+            if p == 0:
+                if q < 0:
+                    return False  # Parallel to this edge and outside it
+                continue
+            t = q / p
+            if p < 0:
+                if t > t1:
+                    return False
+                t0 = max(t0, t)
+            else:
+                if t < t0:
+                    return False
+                t1 = min(t1, t)
+        return True
+
+    def _add_edge_curve(self, path, x1, y1, x2, y2):
+        """Append the curved edge between two nodes to path.
+
+        path: QPainterPath collecting every edge drawn with the same pen
+        x1, y1, x2, y2: graph-space endpoints
+
+        Returns the midpoint of the straight segment, where the score label goes.
+        """
         # Create curved path instead of straight line
-        path = QPainterPath()
         path.moveTo(x1, y1)
 
         # Calculate control point for bezier curve
@@ -612,24 +976,261 @@ class GraphView(QWidget):
             ctrl_x = mid_x
             ctrl_y = mid_y
 
-        # Draw smooth quadratic bezier curve
+        # Smooth quadratic bezier curve
         path.quadTo(ctrl_x, ctrl_y, x2, y2)
+        return mid_x, mid_y
 
-        pen = QPen(color, thickness, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-        painter.setPen(pen)
-        painter.drawPath(path)
+    def _edge_pen(self, alpha, thickness, hovered):
+        """Return the cached pen for an edge.
 
-        # Only show similarity score on hover
-        if self.hovered_node in (idx1, idx2):
-            painter.setFont(QFont('SF Pro Display', 9, QFont.Bold))
-            painter.setPen(QPen(QColor(66, 133, 244)))
-            painter.drawText(int(mid_x), int(mid_y - 5), f"{weight:.2f}")
+        Alpha and thickness are both linear in the similarity, so the integer
+        alpha alone identifies the bucket; at most ~100 pens per hover state,
+        built on first use and then a plain list index.
+        """
+        table = self._edge_pens[hovered]
+        pen = table[alpha]
+        if pen is None:
+            # Modern browser-inspired blue colors
+            if hovered:
+                # Bright blue when hovered (Chrome blue)
+                color = QColor(66, 133, 244, min(255, alpha + 60))
+            else:
+                # Subtle gray-blue for normal edges
+                color = QColor(128, 134, 139, alpha)
+            pen = QPen(color, thickness, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+            table[alpha] = pen
+        return pen
+
+    def _node_style(self, base_color, is_central, hovered):
+        """Return the cached (brush, border pen) for a node style.
 
-    def compute_clusters(self, tabs, tab_indices, threshold=None):
+        Gradients use ObjectBoundingMode so one brush serves every node of the
+        same style regardless of its position or radius.
+        """
+        key = (base_color.rgba() if base_color is not None else None, is_central, hovered)
+        style = self._node_styles.get(key)
+        if style is not None:
+            return style
+
+        gradient = QRadialGradient(0.5, 0.5, 0.5)
+        gradient.setCoordinateMode(QGradient.ObjectBoundingMode)
+        if hovered:
+            # Clean blue gradient (hovered) - Chrome-like
+            gradient.setColorAt(0, QColor(100, 160, 255))
+            gradient.setColorAt(0.7, QColor(66, 133, 244))
+            gradient.setColorAt(1, QColor(50, 110, 200))
+            border_pen = QPen(QColor(66, 133, 244), 2.5)
+        elif is_central:
+            # Brighter gradient for central nodes
+            gradient.setColorAt(0, base_color.lighter(135))
+            gradient.setColorAt(0.7, base_color.lighter(115))
+            gradient.setColorAt(1, base_color.darker(105))
+            border_pen = QPen(base_color.darker(130), 3.5)
+        else:
+            # Subtle radial gradient tinted by cluster color
+            gradient.setColorAt(0, base_color.lighter(120))
+            gradient.setColorAt(0.8, base_color.lighter(105))
+            gradient.setColorAt(1, base_color.darker(110))
+            border_pen = QPen(base_color.darker(120), 2)
+
+        style = (QBrush(gradient), border_pen)
+        self._node_styles[key] = style
+        return style
+
+    def _rebuild_xform(self):
+        """Recompute the cached pan/zoom transforms; call after changing offset_x/offset_y/zoom"""
+        self._xform = QTransform().translate(self.offset_x, self.offset_y).scale(self.zoom, self.zoom)
+        self._inv_xform, _ = self._xform.inverted()
+
+    def _to_graph(self, screen_x, screen_y):
+        """Map a widget position to graph coordinates"""
+        p = self._inv_xform.map(QPointF(screen_x, screen_y))
+        return p.x(), p.y()
+
+    def _visible_graph_rect(self, rect=None):
+        """A widget-space rect (default: the whole widget) in graph coordinates
+        as (left, top, right, bottom)"""
+        if rect is None:
+            rect = self.rect()
+        return self._inv_xform.mapRect(QRectF(rect)).getCoords()
+
+    def _grid_tile(self, antialias):
+        """One grid_size cell of the background: fill colour plus its grid dot"""
+        dpr = self.devicePixelRatioF()
+        key = (antialias, dpr)
+        tile = self._grid_tiles.get(key)
+        if tile is None:
+            grid = self.grid_size
+            tile = QPixmap(round(grid * dpr), round(grid * dpr))
+            tile.setDevicePixelRatio(dpr)
+            tile.fill(self._bg_color)
+            tile_painter = QPainter(tile)
+            tile_painter.setRenderHint(QPainter.Antialiasing, antialias)
+            tile_painter.setPen(self._grid_pen)
+            # The dot sits on the cell corner; antialiased, it spreads over the
+            # four pixels around it, so each tile corner holds its share
+            tile_painter.drawPoints(QPolygon([QPoint(0, 0), QPoint(grid, 0),
+                                              QPoint(0, grid), QPoint(grid, grid)]))
+            tile_painter.end()
+            self._grid_tiles[key] = tile
+        return tile
+
+    def _sprite_scale(self):
+        """Device pixels per graph unit, rounded up, for rendering cached pixmaps"""
+        return max(1, math.ceil(self.zoom * self.devicePixelRatioF()))
+
+    def _node_sprite_scale(self):
+        """Device pixels per graph unit for node sprites, snapped to 16 steps
+        per doubling so zooming reuses sprites (at most ~2% off the true size)"""
+        scale = self.zoom * self.devicePixelRatioF()
+        return 2.0 ** (round(math.log2(scale) * 16) / 16)
+
+    def _label_rect(self, text, width):
+        """Bounding rect of an inline node label, measured once per (text, width)"""
+        key = (text, width)
+        rect = self._label_rects.get(key)
+        if rect is None:
+            if len(self._label_rects) > 1024:
+                self._label_rects.clear()
+            rect = self._fm_label.boundingRect(QRect(0, 0, width, 18), Qt.AlignCenter, text)
+            self._label_rects[key] = rect
+        return rect
+
+    def _node_label_pixmap(self, text, width, scale):
+        """Return (pixmap, width, height) for an inline node label.
+
+        The text is laid out and rasterized once per (text, width, scale);
+        a renamed tab simply looks up a new key.
+        """
+        rect = self._label_rect(text, width)
+        key = f"vertex-label:{width}:{scale}:{text}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap(max(1, int(math.ceil(rect.width() * scale))),
+                             max(1, int(math.ceil(rect.height() * scale))))
+            pixmap.setDevicePixelRatio(scale)
+            pixmap.fill(Qt.transparent)
+            p = QPainter(pixmap)
+            p.setRenderHint(QPainter.TextAntialiasing)
+            p.setFont(self._font_label)
+            p.setPen(self._text_pen)
+            p.drawText(QRectF(0, 0, rect.width(), rect.height()), Qt.AlignCenter, text)
+            p.end()
+            QPixmapCache.insert(key, pixmap)
+        return pixmap, rect.width(), rect.height()
+
+    def _favicon_pixmap(self, icon, size):
+        """Return the tab icon rendered at size, looked up once per icon and size"""
+        key = f"vertex-icon:{icon.cacheKey()}:{size}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = icon.pixmap(QSize(size, size))
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _edge_label_pixmap(self, weight, scale):
+        """Return (pixmap, ascent) for an edge's similarity label, rendering it once"""
+        hundredths = int(round(weight * 100))
+        key = (hundredths, scale)
+        entry = self._label_pixmaps.get(key)
+        if entry is None:
+            text = f"{hundredths / 100:.2f}"
+            fm = self._fm_edge
+            pixmap = QPixmap(int(math.ceil((fm.horizontalAdvance(text) + 2) * scale)),
+                             int(math.ceil(fm.height() * scale)))
+            pixmap.setDevicePixelRatio(scale)
+            pixmap.fill(Qt.transparent)
+            p = QPainter(pixmap)
+            p.setRenderHint(QPainter.TextAntialiasing)
+            p.setFont(self._font_edge)
+            p.setPen(self._edge_label_pen)
+            p.drawText(0, fm.ascent(), text)
+            p.end()
+            entry = (pixmap, fm.ascent())
+            self._label_pixmaps[key] = entry
+        return entry
+
+    def _node_sprite(self, base_color, is_central, hovered, radius, scale):
+        """Return a cached pixmap of a node's shadow, gradient fill and border.
+
+        The pixmap is centred on the node and rendered at `scale` device
+        pixels per graph unit, for drawing 1:1 in device pixels (no transform).
+        """
+        color_key = base_color.rgba() if base_color is not None else 0
+        key = f"vertex-node:{color_key}:{int(is_central)}:{int(hovered)}:{radius}:{scale:.4f}"
+        sprite = QPixmapCache.find(key)
+        if sprite is not None and not sprite.isNull():
+            return sprite
+
+        half = radius + self._sprite_margin
+        side = int(math.ceil(2 * half * scale))
+        dpr = self.devicePixelRatioF()
+        sprite = QPixmap(side, side)
+        sprite.setDevicePixelRatio(dpr)
+        sprite.fill(Qt.transparent)
+
+        node_brush, border_pen = self._node_style(base_color, is_central, hovered)
+        p = QPainter(sprite)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.scale(scale / dpr, scale / dpr)  # The painter already maps logical to device pixels
+
+        # Soft shadow (not glow)
+        p.setBrush(self._shadow_brush)
+        p.setPen(self._no_pen)
+        p.drawEllipse(QPointF(half + 2, half + 3), radius + 2, radius + 2)
+
+        # Node circle
+        p.setBrush(node_brush)
+        p.setPen(border_pen)
+        p.drawEllipse(QPointF(half, half), radius, radius)
+        p.end()
+
+        QPixmapCache.insert(key, sprite)
+        return sprite
+
+    def similarity_matrix(self, tabs, tab_indices):
+        """Symmetric (N, N) array of pair similarities, rows in tab_indices order.
+
+        Each unordered pair is looked up once; thresholding and styling can
+        then run as array operations instead of per-pair Python code.
+        """
+        n = len(tab_indices)
+        sims = np.zeros((n, n))
+        if self.browser.anthropic_client:
+            # A page without extracted content scores 0 against anything but
+            # its own URL, so only pairs where both sides have content are
+            # looked up; duplicate URLs are filled in below.
+            rows = [k for k, idx in enumerate(tab_indices) if tabs[idx]['content']]
+        else:
+            rows = list(range(n))
+
+        m = len(rows)
+        for a in range(m):
+            i = rows[a]
+            tab1 = tabs[tab_indices[i]]
+            for b in range(a + 1, m):
+                j = rows[b]
+                sims[i, j] = self.browser.calculate_similarity_parsed(
+                    tab1, tabs[tab_indices[j]]
+                )
+        sims += sims.T
+
+        # The same page open in several tabs is trivially identical
+        by_url = defaultdict(list)
+        for k, idx in enumerate(tab_indices):
+            by_url[tabs[idx]['url']].append(k)
+        for ks in by_url.values():
+            if len(ks) > 1:
+                sims[np.ix_(ks, ks)] = 1.0
+        np.fill_diagonal(sims, 0.0)
+        return sims
+
+    def compute_clusters(self, tabs, tab_indices, threshold=None, sims=None):
         """Compute clusters as connected components where edge weight >= threshold.
 
         Returns a dict mapping node id -> small integer cluster id.
         This is a simple, fast approach that groups strongly-connected nodes.
+        Pass sims (from similarity_matrix) to skip looking the pairs up again.
         """
         if threshold is None:
             threshold = self.cluster_threshold
@@ -651,17 +1252,11 @@ class GraphView(QWidget):
                 parents[rb] = ra
 
         # Union pairs with similarity >= threshold
-        for i, id1 in enumerate(tab_indices):
-            for id2 in tab_indices[i+1:]:
-                try:
-                    sim = float(self.browser.calculate_similarity(
-                        tabs[id1]['url'], tabs[id2]['url']
-                    ))
-                except Exception:
-                    sim = 0.0
-
-                if sim >= threshold:
-                    union(id1, id2)
+        if sims is None:
+            sims = self.similarity_matrix(tabs, tab_indices)
+        iu, ju = np.nonzero(np.triu(sims >= threshold, k=1))
+        for i, j in zip(iu.tolist(), ju.tolist()):
+            union(tab_indices[i], tab_indices[j])
 
         # Assign compact cluster ids
         cluster_roots = {}
@@ -722,10 +1317,12 @@ class GraphView(QWidget):
 
     def _physics_tick(self):
         """Timer tick: apply a small physics step and request repaint."""
-        if not self.physics_enabled:
+        if not self.physics_enabled or not self.isVisible():
+            # Nothing to animate; showEvent restarts the timer
+            self._physics_timer.stop()
             return
-        # dt in seconds
-        dt = max(0.001, self.physics_interval_ms / 1000.0)
+        # dt in simulated seconds
+        dt = max(0.001, self.physics_step)
         self.apply_physics(dt)
         # repaint will be triggered by update in apply_physics
 
@@ -736,133 +1333,289 @@ class GraphView(QWidget):
         - Repulsive force between all nodes prevents overlap.
         - Velocities are damped each step to settle the system.
 
-        Positions are updated in-place in self.node_positions.
+        Integrates with velocity Verlet: nodes move using the previous step's
+        forces, and velocities use the average of those and the forces at the
+        new positions. All pairwise forces are evaluated as (N, N) array operations; positions
+        are updated in-place in the _xs/_ys arrays.
         """
-        tabs = self.browser.get_web_tabs()
-        node_ids = list(self.node_positions.keys())
+        tabs = self.get_tabs()
+        node_ids = self._row_to_idx
         n = len(node_ids)
         if n < 2:
+            self._physics_timer.stop()  # Nothing to move
             return
 
-        # Ensure velocity entries exist
-        for nid in node_ids:
-            if nid not in self.velocities:
-                self.velocities[nid] = (0.0, 0.0)
-
-        # Prepare force accumulator
-        forces = {nid: [0.0, 0.0] for nid in node_ids}
-
-        # Pairwise interactions
-        for i, id1 in enumerate(node_ids):
-            x1, y1 = self.node_positions[id1]
-            for id2 in node_ids[i+1:]:
-                x2, y2 = self.node_positions[id2]
-                dx = x2 - x1
-                dy = y2 - y1
-                dist_sq = dx*dx + dy*dy
-                dist = math.sqrt(dist_sq) if dist_sq > 0 else 0.001
-
-                # repulsive force (to avoid overlap), inverse-square
-                repulse_mag = self.repulsion_strength / (dist_sq + 1.0)
-                fx = (dx / dist) * repulse_mag
-                fy = (dy / dist) * repulse_mag
-
-                # apply equal and opposite repulsion
-                forces[id1][0] -= fx
-                forces[id1][1] -= fy
-                forces[id2][0] += fx
-                forces[id2][1] += fy
-
-                # attractive force based on similarity (only if above threshold)
-                try:
-                    sim = float(self.browser.calculate_similarity(
-                        tabs[id1]['url'], tabs[id2]['url']
-                    ))
-                except Exception:
-                    sim = 0.0
-
-                if sim > self.attraction_threshold:
-                    # desired distance decreases with higher similarity
-                    desired = 100.0 * (1.0 - min(0.9, sim)) + 30.0
-                    # spring-like attraction: F = k * (dist - desired)
-                    k = self.attraction_strength * sim
-                    spring_mag = k * (dist - desired)
-                    sfx = (dx / dist) * spring_mag
-                    sfy = (dy / dist) * spring_mag
-                    # attraction pulls nodes together (opposite sign)
-                    forces[id1][0] += sfx
-                    forces[id1][1] += sfy
-                    forces[id2][0] -= sfx
-                    forces[id2][1] -= sfy
-
-                # Additional separation when nodes are too close to prevent overlap
-                try:
-                    min_sep = float(self.min_separation)
-                except Exception:
-                    min_sep = 80.0
-
-                if dist < min_sep:
-                    # overlap amount
-                    overlap = max(0.0, min_sep - dist)
-                    sep_mag = self.separation_strength * overlap
-                    # push nodes apart along the line connecting them
-                    sfx2 = (dx / dist) * sep_mag
-                    sfy2 = (dy / dist) * sep_mag
-                    forces[id1][0] -= sfx2
-                    forces[id1][1] -= sfy2
-                    forces[id2][0] += sfx2
-                    forces[id2][1] += sfy2
-
-        # Integrate velocities and update positions
+        # Similarity-derived spring terms only change with the tab snapshot
+        # or node order, so they are built once and reused across ticks
+        key = tuple(node_ids)
+        cached = self._spring_cache
+        if (cached is not None and cached[0] is tabs and cached[1] is self._sim_matrix
+                and cached[2] == key):
+            sims, stiffness, rest = cached[3:]
+        else:
+            sims, stiffness, rest = self._spring_terms(tabs, node_ids)
+            self._spring_cache = (tabs, self._sim_matrix, key, sims, stiffness, rest)
+
+        # Additional separation when nodes are too close to prevent overlap
+        try:
+            min_sep = float(self.min_separation)
+        except Exception:
+            min_sep = 80.0
+
+        def forces():
+            if n >= self.barnes_hut_threshold:
+                return self._forces_barnes_hut(sims, min_sep)
+            return self._forces_exact(stiffness, rest, min_sep)
+
+        if self._fxs is None:
+            self._fxs, self._fys = forces()
+        fx0 = self._fxs
+        fy0 = self._fys
+
+        # Update positions for all nodes at once (acceleration = force, mass=1)
         max_disp = 200.0 * dt  # clamp per-step displacement for stability
-        for nid in node_ids:
-            fx, fy = forces[nid]
-            vx, vy = self.velocities.get(nid, (0.0, 0.0))
-
-            # acceleration = force (mass=1)
-            ax = fx
-            ay = fy
-
-            # integrate
-            vx = (vx + ax * dt) * self.damping
-            vy = (vy + ay * dt) * self.damping
-
-            # clamp velocity to max_disp/dt
-            vmax = max_disp / max(1e-6, dt)
-            vmag = math.sqrt(vx*vx + vy*vy)
-            if vmag > vmax:
-                scale = vmax / vmag
-                vx *= scale
-                vy *= scale
-
-            # update position
-            x, y = self.node_positions[nid]
-            nx = x + vx * dt
-            ny = y + vy * dt
-
-            self.node_positions[nid] = (nx, ny)
-            self.velocities[nid] = (vx, vy)
-
-        # Request repaint
-        self.update()
+        dx = self._vxs * dt + (0.5 * dt * dt) * fx0
+        dy = self._vys * dt + (0.5 * dt * dt) * fy0
+        step = np.hypot(dx, dy)
+        scale = np.where(step > max_disp, max_disp / np.maximum(step, 1e-12), 1.0)
+        dx *= scale
+        dy *= scale
+        self._xs += dx
+        self._ys += dy
+        self._layout_version += 1
+
+        # Velocities from the mean of old and new forces, damped and clamped to max_disp/dt
+        fx, fy = forces()
+        vx = (self._vxs + (0.5 * dt) * (fx0 + fx)) * self.damping
+        vy = (self._vys + (0.5 * dt) * (fy0 + fy)) * self.damping
+        vmax = max_disp / dt
+        vmag = np.hypot(vx, vy)
+        scale = np.where(vmag > vmax, vmax / np.maximum(vmag, 1e-12), 1.0)
+        self._vxs = vx * scale
+        self._vys = vy * scale
+        self._fxs = fx
+        self._fys = fy
+
+        # Request repaint only while something visibly moves; a settled
+        # layout would otherwise be redrawn unchanged on every tick
+        moving = np.minimum(step, max_disp) > self.settle_threshold
+        if self._unpainted_dx is None or len(self._unpainted_dx) != n:
+            self._unpainted_dx = np.zeros(n)
+            self._unpainted_dy = np.zeros(n)
+        self._unpainted_dx += dx
+        self._unpainted_dy += dy
+        if moving.any():
+            self._settled_ticks = 0
+            # Motion is only painted once some node has drifted a visible
+            # fraction of a pixel since the last repaint
+            drift = np.hypot(self._unpainted_dx, self._unpainted_dy)
+            if float(drift.max()) * self.zoom >= self.min_repaint_px:
+                self._repaint_moved(drift > self.settle_threshold)
+        else:
+            self._settled_ticks += 1
+            if self._settled_ticks >= self.settle_ticks:
+                self._physics_timer.stop()
+                # Show wherever the held-back sub-pixel drift ended up
+                if self._unpainted_dx.any() or self._unpainted_dy.any():
+                    self._repaint_moved(None)
+
+    def _repaint_moved(self, moving):
+        """Repaint the nodes that drifted since the last physics repaint
+        (moving mask, or None for the whole widget)"""
+        region = None
+        if moving is not None and moving.any():
+            region = self._moved_region(moving, self._unpainted_dx, self._unpainted_dy)
+        if region is None:
+            self.update()
+        else:
+            self.update(region)
+        self._unpainted_dx[:] = 0.0
+        self._unpainted_dy[:] = 0.0
     
-    def is_on_close_button(self, screen_x, screen_y):
-        """Check if click is on a close button"""
-        if not hasattr(self, 'close_button_positions'):
+    def _moved_region(self, moving, dx, dy):
+        """Widget rect covering the nodes that just moved and their drawn edges.
+
+        moving: (N,) bool mask of rows that moved
+        dx, dy: (N,) displacement since they were last painted
+
+        Returns None when a full repaint is as cheap (most nodes moving, or the
+        hovered node whose popup sits in screen space).
+        """
+        n = len(moving)
+        count = int(moving.sum())
+        if count > n * self.partial_repaint_fraction:
+            return None
+        hovered_row = self._idx_to_row.get(self.hovered_node)
+        if hovered_row is not None and moving[hovered_row]:
             return None
 
-        graph_x = (screen_x - self.offset_x) / self.zoom
-        graph_y = (screen_y - self.offset_y) / self.zoom
+        r1, r2 = self._edge_row_arrays()
+
+        # Edges with a moving end are redrawn whole, so their other end counts too
+        touched = moving.copy()
+        if len(r1):
+            edge_moved = moving[r1] | moving[r2]
+            touched[r1[edge_moved]] = True
+            touched[r2[edge_moved]] = True
+
+        xs = self._xs[touched]
+        ys = self._ys[touched]
+        old_xs = xs - dx[touched]
+        old_ys = ys - dy[touched]
+        # Node body, shadow and label plus the edge curve's bow and score label
+        margin = self.node_cull_margin + 60
+        left = min(xs.min(), old_xs.min()) - margin
+        top = min(ys.min(), old_ys.min()) - margin
+        right = max(xs.max(), old_xs.max()) + margin
+        bottom = max(ys.max(), old_ys.max()) + margin
+        rect = self._xform.mapRect(QRectF(left, top, right - left, bottom - top))
+        return rect.toAlignedRect().adjusted(-2, -2, 2, 2)
+
+    def _edge_row_arrays(self):
+        """Endpoints of the drawn edges as two arrays of node rows"""
+        return self._edge_arrays()[1:3]
+
+    def _edge_arrays(self):
+        """Drawn edges whose ends both have rows, as parallel arrays, rebuilt
+        when the edges or the rows change.
+
+        Returns (positions in _drawn_edges, rows of idx1, rows of idx2, weights)
+        """
+        cached = self._edge_rows
+        if (cached is None or cached[0] is not self._drawn_edges
+                or cached[1] is not self._idx_to_row or cached[2] != len(self._row_to_idx)):
+            rows = self._idx_to_row
+            kept = [k for k, (a, b, *_) in enumerate(self._drawn_edges) if a in rows and b in rows]
+            edges = [self._drawn_edges[k] for k in kept]
+            r1 = np.array([rows[e[0]] for e in edges], dtype=np.intp)
+            r2 = np.array([rows[e[1]] for e in edges], dtype=np.intp)
+            weights = np.array([e[2] for e in edges], dtype=float)
+            cached = (self._drawn_edges, self._idx_to_row, len(self._row_to_idx),
+                      np.array(kept, dtype=np.intp), r1, r2, weights)
+            self._edge_rows = cached
+        return cached[3:]
+
+    def _spring_terms(self, tabs, node_ids):
+        """Similarities for node_ids plus the attraction springs they imply.
+
+        Returns (sims, stiffness, rest) as (N, N) arrays: a pair above
+        attraction_threshold is pulled towards distance rest[i, j] with
+        force stiffness[i, j] * (dist - rest[i, j]); other pairs have
+        zero stiffness.
+        """
+        n = len(node_ids)
+        # Reuse the similarities from the last rebuild if they match this snapshot
+        sims = None
+        if tabs is self._sim_tabs:
+            order = [self._sim_order.get(idx) for idx in node_ids]
+            if None not in order:
+                sims = self._sim_matrix[np.ix_(order, order)]
+        if sims is None:
+            # Rows of just-closed tabs (not yet pruned) have no similarity
+            live = [k for k, idx in enumerate(node_ids) if idx in tabs]
+            sims = np.zeros((n, n))
+            sims[np.ix_(live, live)] = self.browser.get_similarity_matrix([node_ids[k] for k in live])
+
+        # desired distance decreases with higher similarity
+        stiffness = np.where(sims > self.attraction_threshold, self.attraction_strength * sims, 0.0)
+        rest = 100.0 * (1.0 - np.minimum(0.9, sims)) + 30.0
+        return sims, stiffness, rest
+
+    def _forces_exact(self, stiffness, rest, min_sep):
+        """Net force per node from every pair, as (N, N) array operations
+        (or the compiled pair loop when Numba is installed)"""
+        xs = self._xs
+        ys = self._ys
+        if pair_forces is not None:
+            return pair_forces(xs, ys, stiffness, rest, float(self.repulsion_strength),
+                               min_sep, float(self.separation_strength),
+                               float(self.repulsion_cutoff))
+
+        # Three (N, N) scratch arrays reused across ticks, so a tick does all
+        # of its pair math in place instead of allocating temporaries
+        n = len(xs)
+        if self._force_buffers is None or self._force_buffers[0].shape[0] != n:
+            self._force_buffers = tuple(np.empty((n, n)) for _ in range(3))
+        dist, tmp, coeff = self._force_buffers
+
+        # dx[i, j] points from node i to node j
+        np.subtract(xs[None, :], xs[:, None], out=dist)
+        np.subtract(ys[None, :], ys[:, None], out=tmp)
+        np.multiply(dist, dist, out=coeff)
+        tmp *= tmp
+        coeff += tmp  # squared distance
+        np.sqrt(coeff, out=dist)
+        np.maximum(dist, 0.001, out=dist)  # coincident nodes
+
+        # repulsive force (to avoid overlap), inverse-square, shifted down by
+        # its value at the cutoff and clipped so it ends there
+        coeff += 1.0
+        np.divide(-self.repulsion_strength, coeff, out=coeff)
+        cutoff = float(self.repulsion_cutoff)
+        coeff += self.repulsion_strength / (cutoff * cutoff + 1.0)
+        np.minimum(coeff, 0.0, out=coeff)
+
+        # spring-like attraction F = k * (dist - desired) pulls similar nodes together
+        np.subtract(dist, rest, out=tmp)
+        tmp *= stiffness
+        coeff += tmp
+
+        # push apart nodes closer than min_sep
+        np.subtract(min_sep, dist, out=tmp)
+        np.maximum(tmp, 0.0, out=tmp)
+        tmp *= self.separation_strength
+        coeff -= tmp
+
+        # Sum each node's pair forces along the unit vectors towards the others:
+        # sum_j c[i, j] * (x[j] - x[i]) = (c @ x)[i] - x[i] * sum_j c[i, j]
+        np.fill_diagonal(coeff, 0.0)
+        coeff /= dist
+        row_sums = coeff.sum(axis=1)
+        return coeff @ xs - xs * row_sums, coeff @ ys - ys * row_sums
+
+    def _forces_barnes_hut(self, sims, min_sep):
+        """Net force per node with quadtree-approximated repulsion.
+
+        Separation stays exact (the tree never approximates cells within
+        min_sep); attraction only runs over the sparse above-threshold pairs.
+        """
+        tree = QuadTree(self._xs.tolist(), self._ys.tolist())
+        fx, fy = tree.repulsion(self.repulsion_strength, min_sep,
+                                self.separation_strength, self.barnes_hut_theta,
+                                float(self.repulsion_cutoff))
+        fx = np.asarray(fx)
+        fy = np.asarray(fy)
+
+        iu, ju = np.nonzero(np.triu(sims > self.attraction_threshold, k=1))
+        if len(iu):
+            dx = self._xs[ju] - self._xs[iu]
+            dy = self._ys[ju] - self._ys[iu]
+            dist = np.hypot(dx, dy)
+            dist[dist == 0] = 0.001
+            sim = sims[iu, ju]
+            desired = 100.0 * (1.0 - np.minimum(0.9, sim)) + 30.0
+            mag = self.attraction_strength * sim * (dist - desired) / dist
+            np.add.at(fx, iu, mag * dx)
+            np.add.at(fy, iu, mag * dy)
+            np.add.at(fx, ju, -mag * dx)
+            np.add.at(fy, ju, -mag * dy)
+        return fx, fy
+
+    def is_on_close_button(self, screen_x, screen_y):
+        """Check if click is on a close button"""
+        graph_x, graph_y = self._to_graph(screen_x, screen_y)
 
         for idx, (btn_x, btn_y, btn_radius) in self.close_button_positions.items():
-            dist = math.sqrt((graph_x - btn_x)**2 + (graph_y - btn_y)**2)
-            if dist <= btn_radius:
+            dx = graph_x - btn_x
+            dy = graph_y - btn_y
+            if dx * dx + dy * dy <= btn_radius * btn_radius:
                 return idx
         return None
 
     def mousePressEvent(self, event):
         """Handle mouse press for dragging nodes or panning"""
         pos = event.pos()
+        self.wake_physics()
 
         # Check if clicking close button first
         close_idx = self.is_on_close_button(pos.x(), pos.y())
@@ -878,9 +1631,8 @@ class GraphView(QWidget):
                 self.dragging_node = node_idx
                 self.drag_start_pos = pos
                 self.has_dragged = False
-                node_x, node_y = self.node_positions[node_idx]
-                graph_x = (pos.x() - self.offset_x) / self.zoom
-                graph_y = (pos.y() - self.offset_y) / self.zoom
+                node_x, node_y = self._node_xy(node_idx)
+                graph_x, graph_y = self._to_graph(pos.x(), pos.y())
                 self.drag_offset = (graph_x - node_x, graph_y - node_y)
             else:
                 # Start panning
@@ -899,20 +1651,20 @@ class GraphView(QWidget):
 
         if self.dragging_node is not None:
             # Check if we've moved enough to count as a drag
-            if hasattr(self, 'drag_start_pos'):
+            if self.drag_start_pos is not None:
                 dx = pos.x() - self.drag_start_pos.x()
                 dy = pos.y() - self.drag_start_pos.y()
                 if abs(dx) > 5 or abs(dy) > 5:
                     self.has_dragged = True
 
             # Drag node
-            graph_x = (pos.x() - self.offset_x) / self.zoom
-            graph_y = (pos.y() - self.offset_y) / self.zoom
+            graph_x, graph_y = self._to_graph(pos.x(), pos.y())
 
             new_x = graph_x - self.drag_offset[0]
             new_y = graph_y - self.drag_offset[1]
 
-            self.node_positions[self.dragging_node] = (new_x, new_y)
+            self._set_node_xy(self.dragging_node, new_x, new_y)
+            self.wake_physics()
             self.update()
             
         elif self.panning:
@@ -922,6 +1674,7 @@ class GraphView(QWidget):
             
             self.offset_x += dx
             self.offset_y += dy
+            self._rebuild_xform()
             
             self.pan_start = (pos.x(), pos.y())
             self.update()
@@ -932,13 +1685,13 @@ class GraphView(QWidget):
             self.hovered_node = self.get_node_at_pos(pos.x(), pos.y())
             
             if self.hovered_node != old_hover:
-                self.update()
-            
-            # Update cursor
-            if self.hovered_node is not None:
-                self.setCursor(Qt.PointingHandCursor)
-            else:
-                self.setCursor(Qt.ArrowCursor)
+                # Repaint only what the hover change touches
+                self.update(self._hover_region(old_hover).united(self._hover_region(self.hovered_node)))
+
+            # Update cursor, only when its shape actually changes
+            shape = Qt.PointingHandCursor if self.hovered_node is not None else Qt.ArrowCursor
+            if self.cursor().shape() != shape:
+                self.setCursor(shape)
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release"""
@@ -969,10 +1722,14 @@ class GraphView(QWidget):
                     self.selected_cluster = self.cluster_map.get(node_idx, None)
                     self.update()
 
+            was_interacting = self.panning or self.has_dragged
             self.dragging_node = None
             self.panning = False
             self.has_dragged = False
             self.setCursor(Qt.ArrowCursor)
+            if was_interacting:
+                # Final frame with antialiasing restored
+                self.update()
     
     def mouseDoubleClickEvent(self, event):
         """Double-click to switch to tab"""
@@ -1000,6 +1757,7 @@ class GraphView(QWidget):
         zoom_change = self.zoom / old_zoom
         self.offset_x = mouse_x - (mouse_x - self.offset_x) * zoom_change
         self.offset_y = mouse_y - (mouse_y - self.offset_y) * zoom_change
+        self._rebuild_xform()
         
         self.update()
 
@@ -1040,6 +1798,7 @@ class GraphView(QWidget):
             zoom_change = self.zoom / old_zoom
             self.offset_x = center_x - (center_x - self.offset_x) * zoom_change
             self.offset_y = center_y - (center_y - self.offset_y) * zoom_change
+            self._rebuild_xform()
 
             self.update()
 
@@ -1049,14 +1808,55 @@ class GraphView(QWidget):
         return True
 
 
+# JavaScript to extract visible text from a page; built once, shared by every tab
+_EXTRACT_JS = """
+(function() {
+    // Get text from body, excluding script and style tags
+    let clone = document.body.cloneNode(true);
+    let scripts = clone.getElementsByTagName('script');
+    let styles = clone.getElementsByTagName('style');
+
+    for (let i = scripts.length - 1; i >= 0; i--) {
+        scripts[i].remove();
+    }
+    for (let i = styles.length - 1; i >= 0; i--) {
+        styles[i].remove();
+    }
+
+    let text = clone.innerText || clone.textContent || '';
+    // Limit to first 10000 characters to avoid huge API calls
+    return text.substring(0, 10000);
+})();
+""".strip()
+
+
 class BrowserTab(QWidget):
-    """Individual browser tab with address bar and web view"""
+    """Individual browser tab with address bar and web view.
 
-    def __init__(self):
+    The QWebEngineView (and its Chromium render process) is only created by
+    materialize(), when the tab is first shown; until then the requested URL
+    waits in _pending_url.
+    """
+
+    # Re-emitted from the web view once it exists
+    titleChanged = pyqtSignal(str)
+    iconChanged = pyqtSignal(QIcon)
+    # (old_url, new_url) whenever the page URL actually changes
+    urlChanged = pyqtSignal(str, str)
+
+    def __init__(self, browser_parent=None):
         super().__init__()
-        self.web_view = QWebEngineView()
+        self.browser_parent = browser_parent  # Owning Browser window
+        self.web_view = None
+        self._pending_url = None
+        self._last_url = ''
+        # Host and string form of the current URL, taken from the QUrl once
+        # rather than re-parsed or re-converted later
+        self.cached_host = ''
+        self.cached_url = ''
         self.page_content = ""  # Store extracted page content
         self.content_extraction_pending = False
+        self._last_extracted_url = ''  # URL page_content was extracted from
 
         # Layout
         layout = QVBoxLayout()
@@ -1081,71 +1881,103 @@ class BrowserTab(QWidget):
         nav_bar.addWidget(self.url_bar)
         nav_bar.addWidget(self.go_btn)
 
+        # Placeholder until the web view is materialized
+        self._placeholder = QLabel('Loading…')
+        self._placeholder.setAlignment(Qt.AlignCenter)
+
         layout.addLayout(nav_bar)
-        layout.addWidget(self.web_view)
+        layout.addWidget(self._placeholder)
 
         self.setLayout(layout)
 
+    def materialize(self):
+        """Create the web view, wire its signals and load the pending URL"""
+        if self.web_view is not None:
+            return
+
+        self.web_view = QWebEngineView()
+        self.layout().replaceWidget(self._placeholder, self.web_view)
+        self._placeholder.deleteLater()
+        self._placeholder = None
+
         # Connect signals
         self.back_btn.clicked.connect(self.web_view.back)
         self.forward_btn.clicked.connect(self.web_view.forward)
         self.reload_btn.clicked.connect(self.web_view.reload)
         self.web_view.urlChanged.connect(self.update_url_bar)
         self.web_view.loadFinished.connect(self.on_load_finished)
-        
+        self.web_view.titleChanged.connect(self.titleChanged)
+        self.web_view.iconChanged.connect(self.iconChanged)
+
+        if self._pending_url is not None:
+            self.web_view.setUrl(self._pending_url)
+            self._pending_url = None
+
+    def load(self, url):
+        """Load url now, or remember it until the tab is materialized"""
+        if self.web_view is not None:
+            self.web_view.setUrl(url)
+        else:
+            self._pending_url = url
+            self.cached_host = url.host()
+            self.cached_url = url.toString()
+            self.url_bar.setText(self.cached_url)
+
+    def current_url(self):
+        """The loaded URL, or the pending one for a tab that hasn't been shown yet"""
+        if self.web_view is not None:
+            return self.web_view.url()
+        return self._pending_url if self._pending_url is not None else QUrl()
+
     def navigate_to_url(self):
         url = self.url_bar.text()
         if not url.startswith('http'):
             url = 'https://' + url
-        self.web_view.setUrl(QUrl(url))
+        self.load(QUrl(url))
     
     def update_url_bar(self, url):
-        self.url_bar.setText(url.toString())
+        url_str = url.toString()
+        self.url_bar.setText(url_str)
+        self.cached_host = url.host()
+        self.cached_url = url_str
+        if url_str != self._last_url:
+            old_url = self._last_url
+            self._last_url = url_str
+            self.urlChanged.emit(old_url, url_str)
     
-    def extract_page_content(self):
-        """Extract text content from the current page"""
-        if self.content_extraction_pending:
+    def extract_page_content(self, force=False):
+        """Extract text content from the current page
+
+        force: re-extract even if this URL's content was already extracted
+               (a reload or repeated loadFinished of the same page skips it)
+        """
+        if self.content_extraction_pending or self.web_view is None:
             return
 
-        self.content_extraction_pending = True
+        url = self.cached_url
+        if not force and url and url == self._last_extracted_url:
+            return
 
-        # JavaScript to extract visible text from the page
-        js_code = """
-        (function() {
-            // Get text from body, excluding script and style tags
-            let clone = document.body.cloneNode(true);
-            let scripts = clone.getElementsByTagName('script');
-            let styles = clone.getElementsByTagName('style');
-
-            for (let i = scripts.length - 1; i >= 0; i--) {
-                scripts[i].remove();
-            }
-            for (let i = styles.length - 1; i >= 0; i--) {
-                styles[i].remove();
-            }
-
-            let text = clone.innerText || clone.textContent || '';
-            // Limit to first 10000 characters to avoid huge API calls
-            return text.substring(0, 10000);
-        })();
-        """
+        self.content_extraction_pending = True
 
         def handle_content(result):
             if result:
                 self.page_content = result
-                print(f"✓ Extracted content from {self.web_view.url().toString()[:60]}")
+                self._last_extracted_url = url
+                print(f"✓ Extracted content from {url[:60]}")
             else:
                 self.page_content = ""
             self.content_extraction_pending = False
             # Trigger graph update after content is extracted
-            if hasattr(self, 'browser_parent') and self.browser_parent:
-                self.browser_parent.update_graph()
-                # Pre-calculate similarities in background (with delay to avoid blocking)
-                QTimer.singleShot(500, lambda: self.browser_parent.precalculate_similarities())
+            if self.browser_parent is not None:
+                self.browser_parent.update_tab_content(self)
+                # Pre-calculate similarities in background; pages finishing
+                # within a couple of seconds of each other share one pass
+                self.browser_parent.schedule_precalculation()
                 # Pre-generate cluster summaries in background (with delay)
                 QTimer.singleShot(1000, lambda: self.browser_parent.precalculate_cluster_summaries())
 
-        self.web_view.page().runJavaScript(js_code, handle_content)
+        self.web_view.page().runJavaScript(_EXTRACT_JS, handle_content)
 
     def on_load_finished(self, success):
         # Extract page content when page loads
@@ -1153,8 +1985,71 @@ class BrowserTab(QWidget):
             self.extract_page_content()
 
 
+# Query parameters that only track where a click came from, not which page it is
+_TRACKING_PARAM = re.compile(r'^(utm_|fbclid$|gclid$|mc_[ec]id$)', re.IGNORECASE)
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+@lru_cache(maxsize=4096)
+def normalized_url(url):
+    """URL with the parts that don't change the page removed, so variants of
+    one page share similarity scores: in-page fragment, tracking query
+    parameters, host case and the scheme's default port. Other parameters keep their
+    order and encoding."""
+    try:
+        parts = urlsplit(url)
+        netloc = parts.netloc
+        if parts.hostname and '@' not in netloc:
+            host = parts.hostname
+            if ':' in host:
+                host = f'[{host}]'  # IPv6 literal
+            port = parts.port
+            netloc = host if port is None or port == _DEFAULT_PORTS.get(parts.scheme) else f'{host}:{port}'
+        query = '&'.join(param for param in parts.query.split('&')
+                         if param and not _TRACKING_PARAM.match(param.partition('=')[0]))
+        # Hash-routed apps (#/route, #!route) keep the fragment; it picks the page
+        fragment = parts.fragment if parts.fragment[:1] in ('/', '!') else ''
+        return urlunsplit((parts.scheme, netloc, parts.path, query, fragment))
+    except ValueError:
+        return url  # Unparseable (e.g. a bad port); use it as is
+
+
+# Fixed part of the similarity prompt, sent as the system prompt so every
+# request starts with the same cacheable prefix
+_SIMILARITY_INSTRUCTIONS = """You are analyzing the semantic similarity between pairs of web pages. Provide a precise similarity score for each pair.
+
+Analyze how similar the pages of each pair are based on:
+- Topic and subject matter (most important)
+- Content type (article, documentation, shopping, social media, etc.)
+- Domain/category (news, tech, sports, finance, etc.)
+
+Score each pair with a decimal number between 0.00 and 1.00 (use 2 decimal places for precision):
+- 0.00-0.10 = completely unrelated topics
+- 0.20-0.35 = tangentially related (same broad category)
+- 0.40-0.60 = moderately related (overlapping themes)
+- 0.65-0.80 = closely related (similar topics)
+- 0.85-0.95 = very similar (same specific topic)
+- 0.98-1.00 = nearly identical content
+
+Be precise and use the full range. Respond with only one line per pair, its number and score (e.g., 1: 0.73)."""
+
+# A numbered reply line, "k: score" (also "k. score" or "k) score"); a bare
+# "0.73" is not numbered
+_PAIR_LINE_RE = re.compile(r'\s*(\d+)\s*(?:[:)]|\.(?=\s))\s*(.*)')
+
+
 class Browser(QMainWindow):
     """Main browser window with tabbed interface and graph view"""
+
+    # Emitted from summarizer worker threads; delivered queued on the GUI thread
+    summaryReady = pyqtSignal()
+    # ([(url1, url2, score)], persist) for a whole batch from similarity
+    # worker threads, same delivery
+    similarityReady = pyqtSignal(object, bool)
+    # A pair was queued for scoring (from any thread); starts the batch timer
+    similarityQueued = pyqtSignal()
+    # (BrowserTab, content, vector) from embedding worker threads
+    embeddingReady = pyqtSignal(object, str, object)
     
     def __init__(self):
         super().__init__()
@@ -1163,6 +2058,75 @@ class Browser(QMainWindow):
 
         # Initialize graph_tab_index early
         self.graph_tab_index = 0
+        # Set whenever tabs change so GraphView rebuilds its cached edges
+        self._edges_dirty = True
+        # Coalesces bursts of update_graph() calls (title/icon/content signals)
+        # into at most one refresh per graph_update_interval_ms
+        self.graph_update_interval_ms = 200
+        self._graph_timer = QTimer(self)
+        self._graph_timer.setSingleShot(True)
+        self._graph_timer.timeout.connect(self._do_update_graph)
+        self._last_graph_update = 0.0  # time.monotonic() of the last refresh
+        # Set when a refresh was requested while the graph tab was hidden
+        self._pending_graph = False
+        # get_web_tabs() entry per BrowserTab, updated in place from tab signals
+        self._tab_entries = {}
+        # Index -> entry dict handed out by get_web_tabs(); rebuilt (as a new
+        # dict) only when tabs are added/closed or a URL or page content changes
+        self._web_tabs = None
+        # In-memory memo of calculate_similarity: frozenset({url1, url2}) -> score
+        # (set up before the first tab, whose URL signals can fire right away)
+        self._sim_cache = {}
+        self._last_url_set = frozenset()
+        # Incremental pair-similarity matrix: one row per BrowserTab, kept
+        # across graph rebuilds; only rows in _sim_dirty are re-scored
+        self._sim_matrix = np.zeros((0, 0))
+        self._sim_rows = {}
+        self._sim_dirty = set()
+        # Time per graph rebuild spent re-scoring dirty rows; the rest carry
+        # over to the next refresh so a burst of new tabs streams in
+        self.sim_rebuild_budget_ms = 20
+        # Summaries finishing together share one repaint (no graph rebuild needed)
+        self._summary_timer = QTimer(self)
+        self._summary_timer.setSingleShot(True)
+        self._summary_timer.setInterval(50)
+        self._summary_timer.timeout.connect(self._on_summaries_ready)
+        self.summaryReady.connect(self._summary_timer.start)
+        # Similarity API calls run on worker threads; the graph shows a
+        # provisional score until similarityReady delivers the real one.
+        # The calls are network-bound, so several run at once
+        self.sim_workers = 8
+        self._similarity_executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.sim_workers)
+        self._sim_futures = {}  # cache key -> Future
+        self._sim_lock = threading.Lock()
+        self.similarityReady.connect(self._on_similarity_ready)
+        # Pairs queued within 50 ms are scored together, up to
+        # sim_batch_size per API call: cache key -> (url1, url2, content1, content2)
+        self.sim_batch_size = 16
+        self._pending_sim_pairs = {}
+        self._sim_batch_timer = QTimer(self)
+        self._sim_batch_timer.setSingleShot(True)
+        self._sim_batch_timer.setInterval(50)
+        self._sim_batch_timer.timeout.connect(self._flush_sim_batch)
+        self.similarityQueued.connect(self._sim_batch_timer.start)
+        self.embeddingReady.connect(self._on_embedding_ready)
+        # Content arriving for several tabs at once (session restore, a burst
+        # of opened links) triggers one precalculation pass, not one per tab
+        self._precalc_timer = QTimer(self)
+        self._precalc_timer.setSingleShot(True)
+        self._precalc_timer.setInterval(2000)
+        self._precalc_timer.timeout.connect(self.precalculate_similarities)
+        # New scores are written to the cache database at most every 5 s
+        self._cache_save_timer = QTimer(self)
+        self._cache_save_timer.setSingleShot(True)
+        self._cache_save_timer.setInterval(5000)
+        self._cache_save_timer.timeout.connect(self._save_similarity_cache)
+        # ...on one writer thread, so saves keep their order and never block the UI
+        self._cache_writer = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._last_cache_write = None
+
+        # Disk cache and cookies must be configured before the first view is created
+        self._configure_web_profile()
 
         # Tab widget
         self.tabs = QTabWidget()
@@ -1198,14 +2162,40 @@ class Browser(QMainWindow):
         # Add first browser tab
         self.add_new_tab()
 
+        # Local embeddings replace the per-pair Claude similarity call when
+        # sentence-transformers is installed (VERTEX_EMBEDDING_MODEL='' disables)
+        self.embedder = None
+        model_name = os.environ.get('VERTEX_EMBEDDING_MODEL', PageEmbedder.DEFAULT_MODEL)
+        if model_name and PageEmbedder.available():
+            self.embedder = PageEmbedder(model_name)
+            print(f"✓ Local embeddings enabled ({model_name})")
+        # Pairs whose shared-vocabulary score falls outside this band are
+        # settled without Claude (clearly unrelated / near-identical pages)
+        self.lexical_low = 0.1
+        self.lexical_high = 0.85
+        # URL pairs on the same site sharing this fraction of their path and query
+        # tokens (lexical_similarity.url_tokens) are the same page in another form
+        # and score url_match_score outright
+        self.url_match_threshold = 0.9
+        self.url_match_score = 0.95
+
         # Initialize Anthropic client
         api_key = os.environ.get('ANTHROPIC_API_KEY')
         if api_key:
-            self.anthropic_client = Anthropic(api_key=api_key)
+            # One client (and connection pool) shared by similarity, summaries
+            # and search. Idle connections are kept for a minute so bursts of
+            # similarity calls a few seconds apart skip the TLS handshake
+            http_client = DefaultHttpxClient(
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32,
+                                    keepalive_expiry=60.0))
+            self.anthropic_client = Anthropic(
+                api_key=api_key, http_client=http_client,
+                # Short replies; don't let a stalled call hold a worker for minutes
+                timeout=httpx.Timeout(60.0, connect=10.0))
             print("✓ Anthropic API initialized")
         else:
             self.anthropic_client = None
-            print("⚠ ANTHROPIC_API_KEY not set - using random similarity")
+            print("⚠ ANTHROPIC_API_KEY not set - using lexical similarity")
 
         # Prepare cluster summarizer when API available
         if self.anthropic_client:
@@ -1218,10 +2208,26 @@ class Browser(QMainWindow):
         else:
             self.cluster_summarizer = None
 
-        # Cache for similarity scores (url1-url2 -> score)
-        self.similarity_cache = {}
-        # Cache file for persistent storage
-        self.cache_file = os.path.expanduser('./.vertex_browser_cache.json')
+        # Cache for similarity scores ((id1, id2) -> score, see _similarity_key);
+        # filled on demand from the database, so startup cost doesn't grow with its size.
+        # Least recently used entries beyond similarity_cache_size are dropped
+        # (persisted ones are simply read back from the database)
+        self.similarity_cache = OrderedDict()
+        self.similarity_cache_size = 50000
+        self._similarity_cache_lock = threading.Lock()
+        # URLs interned as small ints, so pair keys are int tuples rather
+        # than long concatenated strings
+        self._url_ids = {}
+        self._url_ids_lock = threading.Lock()
+        # Scores not yet written to disk: cache key -> (url1, url2, score)
+        self._unsaved_similarities = {}
+        # SQLite database for persistent storage (one row per pair, so saving
+        # only writes the new rows); the old JSON cache is imported once
+        self.cache_file = os.path.expanduser('./.vertex_browser_cache.db')
+        self._legacy_cache_file = os.path.expanduser('./.vertex_browser_cache.json')
+        self._cache_db = None
+        # Lookups can come from the background clustering thread
+        self._cache_db_lock = threading.Lock()
         self._load_similarity_cache()
 
         # Cache for cluster summaries: frozenset(node ids) -> ClusterSummary
@@ -1333,9 +2339,10 @@ class Browser(QMainWindow):
                 def panel_event_filter(obj, event):
                     if event.type() == QEvent.User and hasattr(panel, '_pending_fuzzy_results'):
                         # Process fuzzy results on main thread
-                        fuzzy_results = panel._pending_fuzzy_results
+                        query, fuzzy_results = panel._pending_fuzzy_results
                         delattr(panel, '_pending_fuzzy_results')
-                        if hasattr(panel, '_update_fuzzy'):
+                        # A slower, older search mustn't replace the current one's results
+                        if hasattr(panel, '_update_fuzzy') and query == getattr(panel, '_current_query', query):
                             panel._update_fuzzy(fuzzy_results)
                         return True
                     return False
@@ -1428,14 +2435,16 @@ class Browser(QMainWindow):
                                 fuzzy_results = fuzzy_searcher.search(clusters, q, min_score=0.0, max_results=50)
                                 print(f"✓ Fuzzy search completed for: '{q}' ({len(fuzzy_results)} results)")
 
+                                # Store results for the event handler before posting it;
+                                # the main thread may handle the event right away
+                                panel._pending_fuzzy_results = (q, fuzzy_results)
+
                                 # Update UI using the app's event loop from background thread
                                 print(f"⏰ Invoking UI update on main thread")
                                 QApplication.instance().postEvent(
                                     panel,
                                     QEvent(QEvent.User)
                                 )
-                                # Store results for the event handler
-                                panel._pending_fuzzy_results = fuzzy_results
                                 print(f"⏰ UI update event posted")
                             except Exception as e:
                                 import traceback
@@ -1549,21 +2558,19 @@ class Browser(QMainWindow):
                     self._cluster_summary_cache[k] = summary
                     self._summary_futures.pop(k, None)
 
-                # Schedule UI update on main thread using thread-safe method
-                try:
-                    app = QApplication.instance()
-                    if app:
-                        # Use invokeMethod to safely call from background thread
-                        QMetaObject.invokeMethod(self.graph_view, "update", Qt.QueuedConnection)
-                        # Also refresh search panel if open
-                        QMetaObject.invokeMethod(self, "_refresh_search_panel", Qt.QueuedConnection)
-                except Exception as e:
-                    print(f"⚠ Error scheduling UI update: {e}")
+                # Schedule UI update on main thread (queued signal)
+                self.summaryReady.emit()
 
             future.add_done_callback(_done)
 
         return "Loading..."
 
+    def _on_summaries_ready(self):
+        """Repaint once for any burst of finished cluster summaries"""
+        self.graph_view.update()
+        # Also refresh search panel if open
+        self._refresh_search_panel()
+
     def _refresh_search_panel(self):
         """Refresh search panel with updated cluster descriptions"""
         try:
@@ -1685,10 +2692,7 @@ class Browser(QMainWindow):
                     self._summary_futures.pop(k, None)
 
                 # Schedule UI update on main thread
-                try:
-                    QTimer.singleShot(0, lambda: self.graph_view.update())
-                except Exception:
-                    pass
+                self.summaryReady.emit()
 
             future.add_done_callback(_done)
 
@@ -1759,50 +2763,131 @@ class Browser(QMainWindow):
                     self._cluster_summary_cache[k] = summary
                     self._summary_futures.pop(k, None)
 
-                try:
-                    QTimer.singleShot(0, lambda: self.graph_view.update())
-                except Exception:
-                    pass
+                self.summaryReady.emit()
 
             future.add_done_callback(_done)
 
         return "Loading..."
     
-    def add_new_tab(self, url='https://www.google.com'):
-        """Add a new browser tab"""
-        browser_tab = BrowserTab()
-        browser_tab.browser_parent = self  # Store reference to browser
-        browser_tab.tab_id = id(browser_tab)  # Unique ID for debugging
+    def _configure_web_profile(self):
+        """Give the default web profile a persistent disk HTTP cache and cookie store"""
+        try:
+            profile = QWebEngineProfile.defaultProfile()
+            profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+            profile.setCachePath(os.path.expanduser('~/.cache/vertex-browser'))
+            profile.setHttpCacheMaximumSize(200 * 1024 * 1024)  # 200 MB
+            profile.setPersistentStoragePath(os.path.expanduser('~/.local/share/vertex-browser'))
+            profile.setPersistentCookiesPolicy(QWebEngineProfile.AllowPersistentCookies)
+        except Exception as e:
+            print(f"⚠ Could not configure web profile cache: {e}")
 
-        idx = self.tabs.addTab(browser_tab, 'New Tab')
-        self.tabs.setCurrentIndex(idx)
+    def add_new_tab(self, url='https://www.google.com', background=False):
+        """Add a new browser tab.
+
+        Background tabs don't create their web view until first shown.
+        """
+        browser_tab = BrowserTab(self)
+        browser_tab.tab_id = id(browser_tab)  # Unique ID for debugging
 
         # Load URL - handle both string URLs and boolean from button clicks
         if isinstance(url, bool):
             url = 'https://www.google.com'
         elif not url.startswith('http'):
             url = 'https://' + url
-        browser_tab.web_view.setUrl(QUrl(url))
-
-        # Update tab title when page loads
-        browser_tab.web_view.titleChanged.connect(
-            lambda title, i=idx: self.update_tab_title(i, title)
-        )
+        # Queued until the tab is materialized (when it becomes current)
+        browser_tab.load(QUrl(url))
 
+        idx = self.tabs.addTab(browser_tab, 'New Tab')
+        self._tab_entries[browser_tab] = {
+            'title': 'New Tab',
+            'full_title': '',
+            'url': browser_tab.cached_url,
+            'host': browser_tab.cached_host,
+            'content': browser_tab.page_content,
+            'widget': browser_tab,
+            'icon': QIcon(),
+            'embedding': None,
+            'terms': None
+        }
+        self._web_tabs = None
+
+        # Update tab title when page loads; the index is looked up per call since tabs shift
+        browser_tab.titleChanged.connect(partial(self.update_tab_title, browser_tab))
+        # Favicons arrive after the title; refresh the cached tab snapshot
+        browser_tab.iconChanged.connect(partial(self._on_tab_icon_changed, browser_tab))
+        # Navigation invalidates memoized similarities for the page left behind
+        browser_tab.urlChanged.connect(partial(self._on_tab_url_changed, browser_tab))
+
+        if not background:
+            self.tabs.setCurrentIndex(idx)
+
+        self._edges_dirty = True
+        self.graph_view.invalidate_tabs()
         return browser_tab
     
     def close_tab(self, idx):
         """Close a tab (but not the graph view)"""
         if idx != self.graph_tab_index and self.tabs.count() > 2:
+            widget = self.tabs.widget(idx)
+            self._tab_entries.pop(widget, None)
+            self._drop_similarity_row(widget)
+            self._web_tabs = None
             self.tabs.removeTab(idx)
+            # Indices shift right away, so drop the stale snapshot before the next paint
+            self._edges_dirty = True
+            self.graph_view.invalidate_tabs()
             self.update_graph()
     
-    def update_tab_title(self, idx, title):
+    def update_tab_title(self, tab, title):
         """Update tab title"""
-        if idx < self.tabs.count():
+        idx = self.tabs.indexOf(tab)
+        if idx != -1:
             short_title = title[:20] + '...' if len(title) > 20 else title
             self.tabs.setTabText(idx, short_title)
-            self.update_graph()
+            entry = self._tab_entries.get(tab)
+            if entry is not None:
+                entry['title'] = short_title
+                entry['full_title'] = title
+            # Titles only label the nodes (similarity is scored from URL and
+            # content), so edges, clusters and the matrix stay as they are
+            if self.tabs.currentIndex() == self.graph_tab_index:
+                self.graph_view.update()
+
+    def update_tab_content(self, tab):
+        """Record a tab's freshly extracted page content"""
+        entry = self._tab_entries.get(tab)
+        if entry is not None:
+            entry['content'] = tab.page_content
+            entry['terms'] = term_vector(tab.page_content) if tab.page_content else None
+            self._web_tabs = None
+            self._sim_dirty.add(tab)
+            if self.embedder is not None and tab.page_content:
+                self._similarity_executor.submit(self._embedding_job, tab, tab.page_content)
+        self.update_graph()
+
+    def _embedding_job(self, tab, content):
+        """Worker thread: embed a tab's page content"""
+        try:
+            vector = self.embedder.encode(content)
+        except Exception as e:
+            print(f"⚠ Error embedding page: {e}")
+            return
+        self.embeddingReady.emit(tab, content, vector)
+
+    def _on_embedding_ready(self, tab, content, vector):
+        """GUI thread: attach an embedding unless the tab's content changed meanwhile"""
+        entry = self._tab_entries.get(tab)
+        if entry is None or entry['content'] != content:
+            return
+        entry['embedding'] = vector
+        self._sim_dirty.add(tab)
+        self.update_graph()
+
+    def _on_tab_icon_changed(self, tab, icon):
+        entry = self._tab_entries.get(tab)
+        if entry is not None:
+            entry['icon'] = icon
+        self.update_graph()
 
     def refresh_all_content(self):
         """Re-extract content from all tabs"""
@@ -1811,181 +2896,591 @@ class Browser(QMainWindow):
         for idx, tab_data in tabs.items():
             widget = tab_data['widget']
             if isinstance(widget, BrowserTab):
-                widget.extract_page_content()
+                widget.extract_page_content(force=True)
     
     def _load_similarity_cache(self):
-        """Load cached similarity scores from disk"""
+        """Open the similarity database; scores are read per pair on first use"""
         try:
-            if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'r') as f:
-                    self.similarity_cache = json.load(f)
-                print(f"✓ Loaded {len(self.similarity_cache)} cached similarities")
+            self._cache_db = sqlite3.connect(self.cache_file, isolation_level=None,
+                                             check_same_thread=False)
+            self._cache_db.execute("PRAGMA journal_mode=WAL")
+            self._cache_db.execute("PRAGMA synchronous=NORMAL")
+            self._cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS sim (k1 TEXT, k2 TEXT, score REAL, PRIMARY KEY (k1, k2))")
+            count = self._cache_db.execute("SELECT COUNT(*) FROM sim").fetchone()[0]
         except Exception as e:
             print(f"⚠ Could not load cache: {e}")
-            self.similarity_cache = {}
+            self._cache_db = None
+            return
+        if not count and os.path.exists(self._legacy_cache_file):
+            # A bad legacy file only costs its scores, not persistence
+            try:
+                count = self._import_legacy_cache()
+            except Exception as e:
+                print(f"⚠ Could not import legacy cache: {e}")
+                if self._cache_db.in_transaction:
+                    self._cache_db.execute("ROLLBACK")
+        print(f"✓ Opened similarity cache ({count} cached similarities)")
+
+    def _cached_similarity(self, cache_key, url1, url2):
+        """Persisted score for a pair, or None; looked up in the database on
+        the first request and kept in similarity_cache from then on"""
+        with self._similarity_cache_lock:
+            score = self.similarity_cache.get(cache_key)
+            if score is not None:
+                self.similarity_cache.move_to_end(cache_key)
+        if score is None:
+            # Evicted before its save went out
+            unsaved = self._unsaved_similarities.get(cache_key)
+            if unsaved is not None:
+                score = unsaved[2]
+                self._remember_similarity(cache_key, score)
+        if score is None and self._cache_db is not None:
+            url1 = normalized_url(url1)
+            url2 = normalized_url(url2)
+            if url2 < url1:
+                url1, url2 = url2, url1
+            try:
+                with self._cache_db_lock:
+                    row = self._cache_db.execute(
+                        "SELECT score FROM sim WHERE k1 = ? AND k2 = ?", (url1, url2)).fetchone()
+            except Exception as e:
+                print(f"⚠ Could not read cache: {e}")
+                return None
+            if row is not None:
+                score = row[0]
+                self._remember_similarity(cache_key, score)
+        return score
+
+    def _remember_similarity(self, cache_key, score):
+        """Keep a score in similarity_cache, evicting the least recently used beyond the cap"""
+        with self._similarity_cache_lock:
+            cache = self.similarity_cache
+            cache[cache_key] = score
+            cache.move_to_end(cache_key)
+            while len(cache) > self.similarity_cache_size:
+                cache.popitem(last=False)
+
+    def _import_legacy_cache(self):
+        """Copy scores from the JSON cache used by earlier versions straight
+        into the database; returns the number of rows imported"""
+        with open(self._legacy_cache_file, 'r') as f:
+            legacy = json.load(f)
+        rows = {}
+        for legacy_key, score in legacy.items():
+            url1, sep, url2 = legacy_key.partition('||')
+            if sep:
+                url1 = normalized_url(url1)
+                url2 = normalized_url(url2)
+                if url2 < url1:
+                    url1, url2 = url2, url1
+                rows[url1, url2] = float(score)
+        with self._cache_db_lock:
+            self._cache_db.execute("BEGIN")
+            self._cache_db.executemany(
+                "INSERT OR REPLACE INTO sim (k1, k2, score) VALUES (?, ?, ?)",
+                [(url1, url2, score) for (url1, url2), score in rows.items()])
+            self._cache_db.execute("COMMIT")
+        return len(rows)
+
+    def _record_similarity(self, cache_key, url1, url2, score):
+        """Store a score in the cache and queue it for the next save"""
+        self._remember_similarity(cache_key, score)
+        url1 = normalized_url(url1)
+        url2 = normalized_url(url2)
+        self._unsaved_similarities[cache_key] = (min(url1, url2), max(url1, url2), score)
+        if not self._cache_save_timer.isActive():
+            self._cache_save_timer.start()
 
     def _save_similarity_cache(self):
-        """Save similarity scores to disk"""
-        try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.similarity_cache, f)
-        except Exception as e:
-            print(f"⚠ Could not save cache: {e}")
+        """Hand scores recorded since the last save to the writer thread"""
+        if not self._unsaved_similarities or self._cache_db is None:
+            return
+        rows = list(self._unsaved_similarities.values())
+        self._unsaved_similarities = {}
+        self._last_cache_write = self._cache_writer.submit(self._write_similarities, rows)
+
+    def _write_similarities(self, rows):
+        """Writer thread: store (k1, k2, score) rows in the cache database"""
+        with self._cache_db_lock:
+            try:
+                # One transaction per save rather than one per row
+                self._cache_db.execute("BEGIN")
+                self._cache_db.executemany(
+                    "INSERT OR REPLACE INTO sim (k1, k2, score) VALUES (?, ?, ?)", rows)
+                self._cache_db.execute("COMMIT")
+            except Exception as e:
+                print(f"⚠ Could not save cache: {e}")
+                if self._cache_db.in_transaction:
+                    self._cache_db.execute("ROLLBACK")
+
+    def closeEvent(self, event):
+        """Flush pending similarity scores before the window goes away"""
+        self._cache_save_timer.stop()
+        self._save_similarity_cache()
+        if self._last_cache_write is not None:
+            # Saves run in order, so the last one finishing means all have
+            concurrent.futures.wait([self._last_cache_write])
+        if self._cache_db is not None:
+            # Move the write-ahead log into the database file, so the cache
+            # on disk is complete on its own even if the process is killed
+            with self._cache_db_lock:
+                try:
+                    self._cache_db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                except Exception as e:
+                    print(f"⚠ Could not checkpoint cache: {e}")
+        super().closeEvent(event)
 
     def get_web_tabs(self):
-        """Get all web tabs (excluding graph view)"""
-        tabs = {}
-        for i in range(self.tabs.count()):
-            if i == self.graph_tab_index:
-                continue
+        """Get all web tabs (excluding graph view).
 
-            widget = self.tabs.widget(i)
-            if isinstance(widget, BrowserTab):
-                content = widget.page_content if hasattr(widget, 'page_content') else ""
-                # Get favicon from the web page
-                icon = widget.web_view.icon()
-                tabs[i] = {
-                    'title': self.tabs.tabText(i),
-                    'url': widget.web_view.url().toString(),
-                    'content': content,
-                    'widget': widget,
-                    'icon': icon
-                }
-        return tabs
+        Entries are kept up to date by the tab signals, so this only re-keys
+        them by index after a structural change. Callers must not mutate it.
+        """
+        if self._web_tabs is None:
+            tabs = {}
+            for i in range(self.tabs.count()):
+                if i == self.graph_tab_index:
+                    continue
+
+                entry = self._tab_entries.get(self.tabs.widget(i))
+                if entry is not None:
+                    tabs[i] = entry
+            self._web_tabs = tabs
+        return self._web_tabs
     
     def calculate_similarity(self, url1, url2):
         """
         Calculate similarity between two tabs using Claude AI to analyze
         page content. Returns a float between 0.0 and 1.0.
+
+        Results are memoized per unordered URL pair so repaints and physics
+        ticks don't rebuild cache keys for every pair on every frame.
         """
-        # Create a cache key (ensure consistent ordering)
-        cache_key = f"{min(url1, url2)}||{max(url1, url2)}"
+        return self._memoized_similarity(url1, url2, None, None)
 
-        # Check cache first
-        if cache_key in self.similarity_cache:
-            return self.similarity_cache[cache_key]
+    def calculate_similarity_parsed(self, tab1, tab2):
+        """
+        Same as calculate_similarity, but takes two get_web_tabs() entries so
+        the page content and host are already at hand rather than looked up
+        per pair.
+        """
+        return self._memoized_similarity(tab1['url'], tab2['url'], tab1, tab2)
 
-        # If no API client, fall back to random similarity
-        if not self.anthropic_client:
-            score = random.random()
-            self.similarity_cache[cache_key] = score
-            return score
+    def get_similarity_matrix(self, tab_indices):
+        """Pair similarities for tab_indices as an (N, N) array.
 
-        # Get tab content for both URLs
+        Rows persist per BrowserTab between calls, so only tabs that are new
+        or whose URL or content changed since the last call are re-scored
+        (O(N) lookups each) instead of every pair. Rows not reached within
+        sim_rebuild_budget_ms keep their previous scores (0 for new tabs)
+        and are re-scored on a follow-up graph refresh. GUI thread only.
+        """
         tabs = self.get_web_tabs()
-        content1 = None
-        content2 = None
-
-        for tab_data in tabs.values():
-            if tab_data['url'] == url1:
-                content1 = tab_data['content']
-            if tab_data['url'] == url2:
-                content2 = tab_data['content']
+        widgets = [tabs[idx]['widget'] for idx in tab_indices]
+
+        new = [w for w in widgets if w not in self._sim_rows]
+        if new:
+            for w in new:
+                self._sim_rows[w] = len(self._sim_rows)
+            self._sim_matrix = np.pad(self._sim_matrix, ((0, len(new)), (0, len(new))))
+            self._sim_dirty.update(new)
+
+        if self._sim_dirty:
+            matrix = self._sim_matrix
+            deadline = time.perf_counter() + self.sim_rebuild_budget_ms / 1000.0
+            done = []
+            embeddings = None  # Built on first use, shared by every dirty row
+            for w in self._sim_dirty:
+                if done and time.perf_counter() > deadline:
+                    break
+                done.append(w)
+                row = self._sim_rows.get(w)
+                if row is None:
+                    continue
+                tab1 = self._tab_entries[w]
+                if self.embedder is not None:
+                    if embeddings is None:
+                        embeddings = self._embedding_matrix()
+                    self._score_embedding_row(matrix, row, tab1, *embeddings)
+                    continue
+                for w2, row2 in self._sim_rows.items():
+                    if w2 is not w:
+                        score = self._prefiltered_similarity(tab1, self._tab_entries[w2])
+                        matrix[row, row2] = matrix[row2, row] = score
+            self._sim_dirty.difference_update(done)
+            if self._sim_dirty:
+                self.update_graph()
+
+        rows = [self._sim_rows[w] for w in widgets]
+        return self._sim_matrix[np.ix_(rows, rows)]
+
+    def _embedding_matrix(self):
+        """Every similarity row's URL plus the rows that have a page embedding
+        and those embeddings stacked, as (urls, rows, (k, dim) matrix)"""
+        urls = np.empty(len(self._sim_rows), dtype=object)
+        rows = []
+        vectors = []
+        for w, row in self._sim_rows.items():
+            entry = self._tab_entries[w]
+            urls[row] = entry['url']
+            if entry['embedding'] is not None:
+                rows.append(row)
+                vectors.append(entry['embedding'])
+        matrix = np.stack(vectors) if vectors else np.zeros((0, 0), dtype=np.float32)
+        return urls, np.array(rows, dtype=np.intp), matrix
+
+    def _score_embedding_row(self, matrix, row, tab1, urls, rows, vectors):
+        """Re-score one similarity row from page embeddings with a single
+        matrix-vector product; same scores as _embedding_similarity per pair"""
+        scores = np.zeros(len(urls))
+        if tab1['embedding'] is not None and len(rows):
+            scores[rows] = np.clip(vectors @ tab1['embedding'], 0.0, 1.0)
+        scores[urls == tab1['url']] = 1.0  # The same page open twice
+        scores[row] = 0.0
+        matrix[row, :] = scores
+        matrix[:, row] = scores
+
+    def _prefiltered_similarity(self, tab1, tab2):
+        """calculate_similarity_parsed, skipping pairs the content scorer
+        would score 0 anyway because a page has no content yet"""
+        if tab1['url'] == tab2['url']:
+            return 1.0
+        if not (tab1['content'] and tab2['content']):
+            return 0.0
+        return float(self.calculate_similarity_parsed(tab1, tab2))
 
-        # If either page has no content yet, cache and return low similarity
-        if not content1 or not content2:
-            # Cache the low result to prevent repeated checks
-            self.similarity_cache[cache_key] = 0.0
+    def _drop_similarity_row(self, widget):
+        """Remove a closed tab's row and column from the similarity matrix"""
+        row = self._sim_rows.pop(widget, None)
+        if row is None:
+            return
+        self._sim_matrix = np.delete(np.delete(self._sim_matrix, row, axis=0), row, axis=1)
+        for w, r in self._sim_rows.items():
+            if r > row:
+                self._sim_rows[w] = r - 1
+        self._sim_dirty.discard(widget)
+
+    def _on_tab_url_changed(self, tab, old_url, new_url):
+        """Track a tab's new URL and evict memoized similarities for a URL
+        that no open tab shows any more"""
+        entry = self._tab_entries.get(tab)
+        if entry is not None:
+            entry['url'] = new_url
+            entry['host'] = tab.cached_host
+            self._web_tabs = None
+            self._sim_dirty.add(tab)
+        if old_url and all(t['url'] != old_url for t in self.get_web_tabs().values()):
+            self._sim_cache = {k: v for k, v in self._sim_cache.items() if old_url not in k}
+        self.update_graph()
+
+    def _memoized_similarity(self, url1, url2, tab1, tab2):
+        """Shared memo lookup for calculate_similarity and its parsed variant"""
+        # The same page open twice is trivially identical
+        if url1 == url2:
+            return 1.0
+
+        if self.embedder is not None:
+            return self._embedding_similarity(url1, url2, tab1, tab2)
+
+        memo_key = frozenset((url1, url2))
+        score = self._sim_cache.get(memo_key)
+        if score is None:
+            score = self._calculate_similarity_uncached(url1, url2, tab1, tab2)
+            if score is None:
+                # Content missing or API call in flight; not memoized so the
+                # real score replaces it
+                return 0.1
+            self._sim_cache[memo_key] = score
+        return score
+
+    def _embedding_similarity(self, url1, url2, tab1, tab2):
+        """Cosine similarity of two tabs' page embeddings (0 until both exist)"""
+        if tab1 is None or tab2 is None:
+            by_url = {t['url']: t for t in self.get_web_tabs().values()}
+            tab1 = by_url.get(url1)
+            tab2 = by_url.get(url2)
+            if tab1 is None or tab2 is None:
+                return 0.0
+        v1 = tab1['embedding']
+        v2 = tab2['embedding']
+        if v1 is None or v2 is None:
             return 0.0
+        return PageEmbedder.similarity(v1, v2)
+
+    def _url_id(self, url):
+        """Interned id of a URL, assigned on first sight; URLs that normalize
+        to the same page (normalized_url) share one id"""
+        uid = self._url_ids.get(url)
+        if uid is None:
+            norm = normalized_url(url)
+            with self._url_ids_lock:
+                # Ids only need to be unique, and len() only grows
+                uid = self._url_ids.setdefault(norm, len(self._url_ids))
+                self._url_ids[url] = uid
+        return uid
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _url_tokens(url):
+        """Site and path tokens of a URL's normalized form (see url_tokens)"""
+        return url_tokens(normalized_url(url))
+
+    def _similarity_key(self, url1, url2):
+        """Cache key for an unordered URL pair: (smaller id, larger id)"""
+        id1 = self._url_id(url1)
+        id2 = self._url_id(url2)
+        return (id1, id2) if id1 < id2 else (id2, id1)
+
+    def _calculate_similarity_uncached(self, url1, url2, tab1=None, tab2=None):
+        """Compute a similarity score, consulting the persistent cache first;
+        None while it can't be known yet (no content, or queued for Claude)"""
+        cache_key = self._similarity_key(url1, url2)
 
-        try:
-            # Use Claude to analyze similarity
-            prompt = f"""You are analyzing the semantic similarity between two web pages. Provide a precise similarity score.
-
-            Page 1 URL: {url1}
-            Page 1 Content:
-            {content1[:3000]}
-
-            Page 2 URL: {url2}
-            Page 2 Content:
-            {content2[:3000]}
-
-            Analyze how similar these pages are based on:
-            - Topic and subject matter (most important)
-            - Content type (article, documentation, shopping, social media, etc.)
-            - Domain/category (news, tech, sports, finance, etc.)
-
-            Respond with ONLY a decimal number between 0.00 and 1.00 (use 2 decimal places for precision):
-            - 0.00-0.10 = completely unrelated topics
-            - 0.20-0.35 = tangentially related (same broad category)
-            - 0.40-0.60 = moderately related (overlapping themes)
-            - 0.65-0.80 = closely related (similar topics)
-            - 0.85-0.95 = very similar (same specific topic)
-            - 0.98-1.00 = nearly identical content
-
-            Be precise and use the full range. Respond with ONLY the number (e.g., 0.73)."""
-
-            message = self.anthropic_client.messages.create(
-                model="claude-3-5-haiku-20241022",  # Fast and cost-effective
-                max_tokens=10,
-                messages=[{"role": "user", "content": prompt}]
-            )
+        # Check cache first
+        score = self._cached_similarity(cache_key, url1, url2)
+        if score is not None:
+            return score
+
+        # Near-identical URLs need neither content nor Claude
+        site1, tokens1 = self._url_tokens(url1)
+        site2, tokens2 = self._url_tokens(url2)
+        if site1 == site2 and jaccard(tokens1, tokens2) >= self.url_match_threshold:
+            score = self.url_match_score
+            self._remember_similarity(cache_key, score)
+            return score
 
-            # Parse the response - extract just the number
-            response_text = message.content[0].text.strip()
-            # Take only the first line and extract the number
-            first_line = response_text.split('\n')[0].strip()
-            similarity = float(first_line)
-            similarity = max(0.0, min(1.0, similarity))  # Clamp to [0, 1]
+        # Get tab entries for both URLs
+        if tab1 is None or tab2 is None:
+            for tab_data in self.get_web_tabs().values():
+                if tab_data['url'] == url1:
+                    tab1 = tab_data
+                if tab_data['url'] == url2:
+                    tab2 = tab_data
+        content1 = tab1['content'] if tab1 is not None else None
+        content2 = tab2['content'] if tab2 is not None else None
+        terms1 = tab1['terms'] if tab1 is not None else None
+        terms2 = tab2['terms'] if tab2 is not None else None
+
+        # If no API client, fall back to lexical similarity once both pages
+        # have content; until then the caller gets an unmemoized placeholder
+        if not self.anthropic_client:
+            if terms1 is None or terms2 is None:
+                return None
+            score = lexical_cosine(terms1, terms2)
+            self._remember_similarity(cache_key, score)
+            return score
 
-            # Cache the result
-            self.similarity_cache[cache_key] = similarity
-            self._save_similarity_cache()
+        # If either page has no content yet there is nothing to score; not
+        # cached, so the pair is scored once the content arrives
+        if not content1 or not content2:
+            return None
 
-            print(f"✓ Similarity: {similarity:.2f} - {url1[:40]}... ↔ {url2[:40]}...")
-            return similarity
+        # Clear-cut pairs are settled by shared vocabulary alone; only the
+        # uncertain middle band is worth a Claude call
+        if terms1 is not None and terms2 is not None:
+            score = lexical_cosine(terms1, terms2)
+            if score < self.lexical_low or score > self.lexical_high:
+                self._remember_similarity(cache_key, score)
+                return score
+
+        # Queue the pair for the next batch; the caller gets a provisional
+        # value until similarityReady delivers the result
+        with self._sim_lock:
+            if cache_key in self._sim_futures or cache_key in self._pending_sim_pairs:
+                return None
+            self._pending_sim_pairs[cache_key] = (url1, url2, content1, content2)
+        self.similarityQueued.emit()
+        return None
 
+    def _flush_sim_batch(self):
+        """Hand the queued pairs to the worker threads, sim_batch_size per API call"""
+        with self._sim_lock:
+            pending = list(self._pending_sim_pairs.items())
+            self._pending_sim_pairs = {}
+            # Spread a small queue over every worker rather than one big request
+            size = max(1, min(self.sim_batch_size, math.ceil(len(pending) / self.sim_workers)))
+            for start in range(0, len(pending), size):
+                batch = pending[start:start + size]
+                future = self._similarity_executor.submit(
+                    self._similarity_job, [pair for _, pair in batch])
+                for cache_key, _ in batch:
+                    self._sim_futures[cache_key] = future
+
+    def _similarity_job(self, pairs):
+        """Worker thread: score a batch of pairs and hand them to the GUI thread"""
+        try:
+            scores = self._request_similarities(pairs)
         except Exception as e:
             print(f"⚠ Error calculating similarity: {e}")
-            # Fall back to basic domain comparison
-            try:
-                domain1 = QUrl(url1).host()
-                domain2 = QUrl(url2).host()
-                if domain1 == domain2:
-                    return 0.7
-                return 0.1
-            except:
-                return 0.1
-    
+            scores = [None] * len(pairs)
+
+        scored = []
+        failed = []
+        for (url1, url2, _, _), similarity in zip(pairs, scores):
+            if similarity is not None:
+                scored.append((url1, url2, similarity))
+            else:
+                # Not memoized, so the pair is queued again when its rows refresh
+                failed.append((url1, url2, None))
+        if scored:
+            print(f"✓ Similarity: scored {len(scored)} pair(s) in one request")
+            if failed:
+                print(f"⚠ Similarity: {len(failed)} unreadable score(s), retrying later")
+
+        # One queued event per batch rather than one per pair
+        if scored:
+            self.similarityReady.emit(scored, True)
+        if failed:
+            self.similarityReady.emit(failed, False)
+
+    def _request_similarities(self, pairs):
+        """Blocking Claude call scoring a batch of pairs; raises on API errors or
+        a reply whose scores can't be matched to the pairs. Returns one score
+        per pair, None where that pair's line is missing or has no score
+        between 0 and 1.
+
+        Each distinct page is sent once, so pairs sharing a page (the common
+        case when several tabs open at once) don't repeat its content.
+        """
+        page_ids = {}
+        pages = []
+        for url1, url2, content1, content2 in pairs:
+            for url, content in ((url1, content1), (url2, content2)):
+                if url not in page_ids:
+                    page_ids[url] = len(page_ids) + 1
+                    pages.append(f"Page {page_ids[url]} URL: {url}\n"
+                                 f"Page {page_ids[url]} Content:\n"
+                                 f"{content[:3000]}")
+        pages_text = "\n\n".join(pages)
+        pairs_text = "\n".join(
+            f"{k}. Page {page_ids[url1]} vs Page {page_ids[url2]}"
+            for k, (url1, url2, _, _) in enumerate(pairs, 1))
+
+        # Use Claude to analyze similarity; the fixed instructions go first, as a
+        # system block marked for prompt caching, and only the pages vary
+        prompt = f"""{pages_text}
+
+Pairs to score:
+{pairs_text}
+
+Respond with ONLY {len(pairs)} lines, one per pair, in the form "pair number: score" (e.g., 1: 0.73)."""
+
+        message = self.anthropic_client.messages.create(
+            model="claude-3-5-haiku-20241022",  # Fast and cost-effective
+            max_tokens=max(10, 8 * len(pairs)),
+            system=[{"type": "text", "text": _SIMILARITY_INSTRUCTIONS,
+                     "cache_control": {"type": "ephemeral"}}],
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+        # Parse the response - each score is keyed by its pair number, so prose
+        # around the lines or a skipped pair can't shift scores onto other pairs
+        lines = [line for line in message.content[0].text.splitlines() if line.strip()]
+        numbered = {}
+        for line in lines:
+            match = _PAIR_LINE_RE.match(line)
+            if match:
+                k = int(match.group(1))
+                if 1 <= k <= len(pairs) and k not in numbered:
+                    numbered[k] = parse_score(match.group(2))
+        if numbered:
+            # A missing or unreadable line only makes its own pair fall back
+            return [numbered.get(k) for k in range(1, len(pairs) + 1)]
+        # Unnumbered reply: only trusted when its lines match the pairs one-to-one
+        if len(lines) != len(pairs):
+            raise ValueError(f"expected {len(pairs)} scores, got {len(lines)} lines")
+        return [parse_score(line) for line in lines]
+
+    def _on_similarity_ready(self, results, persist):
+        """GUI thread: store a finished batch of similarities and re-score the affected rows"""
+        keys = [self._similarity_key(url1, url2) for url1, url2, _ in results]
+        with self._sim_lock:
+            for cache_key in keys:
+                self._sim_futures.pop(cache_key, None)
+        if persist:
+            for cache_key, (url1, url2, score) in zip(keys, results):
+                self._record_similarity(cache_key, url1, url2, score)
+
+        open_urls = {}
+        for w, entry in self._tab_entries.items():
+            open_urls.setdefault(entry['url'], []).append(w)
+        affected = set()
+        for url1, url2, score in results:
+            if url1 in open_urls or url2 in open_urls:
+                if persist:
+                    self._sim_cache[frozenset((url1, url2))] = score
+                affected.update(open_urls.get(url1, ()))
+                affected.update(open_urls.get(url2, ()))
+        if not affected:
+            return  # Every page was navigated away from or closed meanwhile
+        self._sim_dirty.update(affected)
+        if persist:
+            self.update_graph()
+        # Failed pairs stay unmemoized, so the next refresh of their rows
+        # queues them again; not forcing one here keeps an outage from
+        # turning into a tight retry loop
+
     def update_graph(self):
+        """Schedule a graph refresh on the next event loop pass, or once
+        graph_update_interval_ms has passed since the last one; every call
+        until then shares that refresh"""
+        if self.tabs.currentIndex() != self.graph_tab_index:
+            # Nothing to show; refresh once the graph tab is opened
+            self._pending_graph = True
+            # showEvent wakes the physics when the graph tab opens
+            self.graph_view.invalidate_tabs(wake=False)
+            return
+        if not self._graph_timer.isActive():
+            elapsed_ms = (time.monotonic() - self._last_graph_update) * 1000
+            self._graph_timer.start(int(max(0.0, self.graph_update_interval_ms - elapsed_ms)))
+
+    def _do_update_graph(self):
         """Update the graph view"""
+        self._last_graph_update = time.monotonic()
+        self._edges_dirty = True
+        self.graph_view.invalidate_tabs()
+        tabs = self.graph_view.get_tabs()
+
+        # Only prune the similarity memo when the set of open URLs changed
+        url_set = frozenset(tab_data['url'] for tab_data in tabs.values())
+        if url_set != self._last_url_set:
+            self._sim_cache = {k: v for k, v in self._sim_cache.items() if k <= url_set}
+            self._last_url_set = url_set
+
         self.graph_view.update()
 
+    def schedule_precalculation(self):
+        """Run precalculate_similarities once content stops arriving for 2 s"""
+        self._precalc_timer.start()
+
     def precalculate_similarities(self):
         """Pre-calculate all similarities in background to populate cache"""
-        if not self.anthropic_client:
-            return  # No API, can't precalculate
+        if not self.anthropic_client or self.embedder is not None:
+            return  # No API (or local embeddings), nothing to precalculate
 
         tabs = self.get_web_tabs()
-        tab_indices = list(tabs.keys())
+        # Tabs not loaded yet (lazy background tabs) have nothing to score
+        tab_indices = [idx for idx, tab in tabs.items() if tab['content']]
 
         if len(tab_indices) < 2:
             return
 
-        # Submit background jobs to calculate all pairwise similarities
-        def calculate_pair(idx1, idx2):
-            try:
-                url1 = tabs[idx1]['url']
-                url2 = tabs[idx2]['url']
-                # This will cache the result
-                self.calculate_similarity(url1, url2)
-            except Exception as e:
-                print(f"⚠ Background similarity calculation error: {e}")
-
-        # Use existing thread pool executor to calculate similarities
-        for i, idx1 in enumerate(tab_indices):
-            for idx2 in tab_indices[i+1:]:
+        # Queue the uncached pairs; the API calls themselves run on the
+        # similarity worker threads, so this doesn't block.
+        # Sorted by URL id, so id1 <= id2 below and the cache key needs no min/max
+        tab_indices.sort(key=lambda idx: self._url_id(tabs[idx]['url']))
+        urls = [tabs[idx]['url'] for idx in tab_indices]
+        ids = [self._url_id(url) for url in urls]
+        n = len(tab_indices)
+        for i in range(n):
+            idx1 = tab_indices[i]
+            url1 = urls[i]
+            id1 = ids[i]
+            for j in range(i + 1, n):
                 # Check if already cached
-                url1 = tabs[idx1]['url']
-                url2 = tabs[idx2]['url']
-                cache_key = f"{min(url1, url2)}||{max(url1, url2)}"
-
-                if cache_key not in self.similarity_cache:
-                    # Submit background calculation
-                    try:
-                        self._summary_executor.submit(calculate_pair, idx1, idx2)
-                    except Exception:
-                        pass  # Executor might be full, that's OK
+                if self._cached_similarity((id1, ids[j]), url1, urls[j]) is None:
+                    self.calculate_similarity_parsed(tabs[idx1], tabs[tab_indices[j]])
 
     def precalculate_cluster_summaries(self):
         """Pre-generate cluster summaries in background"""
@@ -2067,18 +3562,8 @@ class Browser(QMainWindow):
 
                                 print(f"✓ Cluster summary completed for {len(k)} pages")
 
-                                # Schedule UI update on main thread using the application instance
-                                # This ensures it runs on the main thread's event loop
-                                try:
-                                    app = QApplication.instance()
-                                    if app:
-                                        # Use invokeMethod to safely call from background thread
-                                        from PyQt5.QtCore import QMetaObject, Q_ARG
-                                        QMetaObject.invokeMethod(self.graph_view, "update", Qt.QueuedConnection)
-                                        # Also refresh search panel if open
-                                        QMetaObject.invokeMethod(self, "_refresh_search_panel", Qt.QueuedConnection)
-                                except Exception as e:
-                                    print(f"⚠ Error scheduling UI update: {e}")
+                                # Schedule UI update on main thread (queued signal)
+                                self.summaryReady.emit()
 
                             future.add_done_callback(_done)
                         except Exception as e:
@@ -2096,8 +3581,18 @@ class Browser(QMainWindow):
 
     def on_tab_changed(self, idx):
         """Handle tab changes"""
+        widget = self.tabs.widget(idx)
+        if isinstance(widget, BrowserTab):
+            widget.materialize()
         if idx == self.graph_tab_index:
-            self.update_graph()
+            # Queue every uncached pair up front so the workers start on all
+            # of them before the first paint asks for scores
+            self.precalculate_similarities()
+            if self._pending_graph:
+                self._pending_graph = False
+                self._do_update_graph()
+            else:
+                self.update_graph()
 
 
 def main():
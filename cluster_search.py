@@ -12,6 +12,16 @@ from anthropic import Anthropic
 import re
 import time
 
+# A score between 0 and 1 in a model reply (0, 0.73, .73, 1, 1.0); never part
+# of a larger number, so "12", "73%" or "1.5" don't read as a score
+_SCORE_RE = re.compile(r'(?<![\d.])(?:0(?:\.\d+)?|1(?:\.0+)?|\.\d+)(?!\.?\d)')
+
+
+def parse_score(line: str) -> Optional[float]:
+    """Last 0-1 score on a line of model output, or None if it has none"""
+    scores = _SCORE_RE.findall(line)
+    return float(scores[-1]) if scores else None
+
 
 class SearchResult:
     """Represents a search result with ranking information"""
@@ -61,6 +71,7 @@ class ClusterSearcher:
         self.anthropic_client = anthropic_client
         self.enable_fuzzy = enable_fuzzy and anthropic_client is not None
         self.fuzzy_cache = {}  # Cache for fuzzy similarity scores
+        self._mask_cache = {}  # Cache for character-bigram bitmasks (text -> int)
 
     def search(
         self,
@@ -212,8 +223,12 @@ class ClusterSearcher:
         exact_matches = 0
         partial_matches = 0
 
+        # A substring's bigrams are a subset of the text's, so any bigram bit
+        # missing from the text rules the match out without scanning it
+        text_mask = self._bigram_mask(text)
+
         # Exact phrase match
-        if query in text:
+        if not self._bigram_mask(query) & ~text_mask and query in text:
             # Count occurrences
             count = text.count(query)
             score += count * 2.0  # 2 points per exact match
@@ -221,13 +236,29 @@ class ClusterSearcher:
 
         # Individual term matches
         for term in query_terms:
-            if term in text:
+            if not self._bigram_mask(term) & ~text_mask and term in text:
                 count = text.count(term)
                 score += count * 0.5  # 0.5 points per term match
                 partial_matches += count
 
         return score, exact_matches, partial_matches
 
+    def _bigram_mask(self, text: str) -> int:
+        """
+        64-bit mask with one (hashed) bit per character bigram in text.
+
+        Cluster texts are stable across queries, so masks are cached.
+        """
+        mask = self._mask_cache.get(text)
+        if mask is None:
+            mask = 0
+            for a, b in zip(text, text[1:]):
+                mask |= 1 << ((ord(a) * 31 + ord(b)) & 63)
+            if len(self._mask_cache) > 4096:
+                self._mask_cache.clear()
+            self._mask_cache[text] = mask
+        return mask
+
     def _tokenize(self, text: str) -> List[str]:
         """
         Tokenize text into search terms.
@@ -290,22 +321,12 @@ Respond with ONLY a decimal number between 0.00 and 1.00 (e.g., 0.73)."""
                 messages=[{"role": "user", "content": prompt}]
             )
 
+            # Take the score from the first line (handle cases where AI adds explanations)
             response_text = message.content[0].text.strip()
-
-            # Extract just the first number (handle cases where AI adds explanations)
-            # Take only the first line and extract the number
-            first_line = response_text.split('\n')[0].strip()
-
-            # Try to extract a decimal number from the first line
-            import re
-            number_match = re.search(r'(\d+\.?\d*)', first_line)
-            if number_match:
-                similarity = float(number_match.group(1))
-            else:
+            similarity = parse_score(response_text.split('\n')[0])
+            if similarity is None:
                 similarity = 0.0
 
-            similarity = max(0.0, min(1.0, similarity))
-
             # Cache the result
             self.fuzzy_cache[cache_key] = similarity
 
@@ -5,9 +5,14 @@ Uses a map-reduce approach with Claude to handle large numbers of documents:
 1. Map: Summarize each document individually
 2. Reduce: Hierarchically combine summaries
 3. Extract: Generate a concise topic-based title
+
+Calls within a phase don't depend on each other, so they run concurrently
+on a small thread pool; a cluster costs roughly one round-trip per phase
+rather than one per document.
 """
 
 import time
+import concurrent.futures
 from typing import List, Dict, Optional
 from anthropic import Anthropic
 
@@ -41,6 +46,9 @@ class ClusterSummarizer:
         self.max_retries = 3
         self.retry_delay = 1.0  # seconds
         self.enable_tags = enable_tags  # Backwards compatible - tags disabled by default
+        # Claude calls in flight at once, shared by every cluster being summarized
+        self.max_concurrent_calls = 8
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrent_calls)
 
     def summarize_cluster(self, documents: List[Dict[str, str]]) -> ClusterSummary:
         """
@@ -65,15 +73,16 @@ class ClusterSummarizer:
         print(f"🔄 Combining summaries...")
         final_summary = self._reduce_phase(individual_summaries)
 
-        # Generate title
+        # Generate title (and tags if enabled) - both only need the final summary
         print(f"🏷️  Generating title...")
-        title = self._extract_title(final_summary, documents)
+        title_future = self._executor.submit(self._extract_title, final_summary, documents)
 
         # Extract tags if enabled
         tags = []
         if self.enable_tags:
             print(f"🏷️  Extracting tags...")
             tags = self._extract_tags(final_summary, documents)
+        title = title_future.result()
 
         return ClusterSummary(
             title=title,
@@ -84,22 +93,25 @@ class ClusterSummarizer:
         )
 
     def _map_phase(self, documents: List[Dict[str, str]]) -> List[str]:
-        """Summarize each document individually"""
-        summaries = []
+        """Summarize each document individually (concurrently, results in document order)"""
+        total = len(documents)
+        return list(self._executor.map(
+            lambda item: self._summarize_document(item[1], f"[{item[0]+1}/{total}]"),
+            enumerate(documents)))
 
-        for i, doc in enumerate(documents):
-            print(f"  [{i+1}/{len(documents)}] Summarizing: {doc['title'][:40]}...")
+    def _summarize_document(self, doc: Dict[str, str], position: str) -> str:
+        """Summarize one document in a sentence"""
+        print(f"  {position} Summarizing: {doc['title'][:40]}...")
 
-            # Truncate content if too long
-            content = doc['content'][:self.max_content_chars]
+        # Truncate content if too long
+        content = doc['content'][:self.max_content_chars]
 
-            # Skip if content is empty or too short
-            if not content or len(content.strip()) < 20:
-                print(f"    ⚠ Skipping - insufficient content")
-                summaries.append(f"Page about {doc['title']}")
-                continue
+        # Skip if content is empty or too short
+        if not content or len(content.strip()) < 20:
+            print(f"    ⚠ Skipping - insufficient content")
+            return f"Page about {doc['title']}"
 
-            prompt = f"""Summarize this web page in one clear, complete sentence that describes what the page is about.
+        prompt = f"""Summarize this web page in one clear, complete sentence that describes what the page is about.
 
 URL: {doc['url']}
 Title: {doc['title']}
@@ -111,17 +123,15 @@ Example format: "This page covers [topic] and explains [key points]."
 
 Your summary:"""
 
-            summary = self._call_claude_with_retry(prompt, max_tokens=100)
-
-            # Validate summary - check for placeholder/error patterns
-            summary_lower = summary.lower()
-            if any(phrase in summary_lower for phrase in ['placeholder', 'error', 'cannot', 'unable to', 'i apologize', 'i cannot']):
-                print(f"    ⚠ Got placeholder/error response, using fallback")
-                summary = f"Web page about {doc['title']}"
+        summary = self._call_claude_with_retry(prompt, max_tokens=100)
 
-            summaries.append(summary)
+        # Validate summary - check for placeholder/error patterns
+        summary_lower = summary.lower()
+        if any(phrase in summary_lower for phrase in ['placeholder', 'error', 'cannot', 'unable to', 'i apologize', 'i cannot']):
+            print(f"    ⚠ Got placeholder/error response, using fallback")
+            summary = f"Web page about {doc['title']}"
 
-        return summaries
+        return summary
 
     def _reduce_phase(self, summaries: List[str]) -> str:
         """Hierarchically combine summaries into one final sentence"""
@@ -134,19 +144,12 @@ Your summary:"""
         current_summaries = summaries[:]
 
         while len(current_summaries) > 1:
-            next_level = []
-
-            # Process in batches
-            for i in range(0, len(current_summaries), self.batch_size):
-                batch = current_summaries[i:i + self.batch_size]
-
-                if len(batch) == 1:
-                    next_level.append(batch[0])
-                else:
-                    combined = self._combine_summaries(batch)
-                    next_level.append(combined)
-
-            current_summaries = next_level
+            # Process in batches; the batches of one level are combined concurrently
+            batches = [current_summaries[i:i + self.batch_size]
+                       for i in range(0, len(current_summaries), self.batch_size)]
+            current_summaries = list(self._executor.map(
+                lambda batch: batch[0] if len(batch) == 1 else self._combine_summaries(batch),
+                batches))
 
         return current_summaries[0]
 
@@ -0,0 +1,87 @@
+"""
+Cheap lexical similarity between pages.
+
+Scores a pair from the words the two pages share, so clear-cut pairs don't
+need a Claude call:
+- Each page becomes a sparse term vector once, when its content arrives
+- Pair similarity is a cosine over the shared terms (no network, microseconds)
+- Browser only trusts it near the ends of the range; pairs in the uncertain
+  middle band still go to Claude
+- URLs on the same host and port that differ only in form (scheme, www,
+  slashes, parameter order) are recognized from their tokens alone, before
+  any content is needed
+"""
+
+from collections import Counter
+from typing import Dict, FrozenSet, Tuple
+from urllib.parse import urlsplit
+import math
+import re
+
+# Words of 3+ letters/digits; shorter ones are mostly noise
+_TOKEN = re.compile(r"\w{3,}")
+
+# Frequent English words that say nothing about a page's topic
+STOPWORDS = frozenset("""
+the and for are but not you all any can had her was one our out has him his how
+its may new now old see two way who did get let say she too use with that this
+from they will have been were what when where which while your their there then
+them than also into more most some such only over just like about after before
+other these those would could should because being very here home menu sign
+""".split())
+
+
+def term_vector(text: str, max_chars: int = 3000) -> Dict[str, float]:
+    """
+    Unit-length term vector of a page's text, with sublinear term frequency
+    (1 + log count) so a few repeated words don't dominate.
+
+    Args:
+        max_chars: Same page excerpt the Claude prompt uses
+
+    Returns:
+        term -> weight, empty for text without any terms
+    """
+    counts = Counter(t for t in _TOKEN.findall(text[:max_chars].lower()) if t not in STOPWORDS)
+    weights = {t: 1.0 + math.log(c) for t, c in counts.items()}
+    norm = math.sqrt(sum(w * w for w in weights.values()))
+    if not norm:
+        return {}
+    return {t: w / norm for t, w in weights.items()}
+
+
+def cosine(v1: Dict[str, float], v2: Dict[str, float]) -> float:
+    """Cosine similarity of two term vectors, in [0, 1]"""
+    # Only shared terms contribute; intersecting the key sets (in C) first
+    # skips the Python-level lookup of every term the pages don't share
+    return min(1.0, sum(v1[t] * v2[t] for t in v1.keys() & v2.keys()))
+
+
+def url_tokens(url: str) -> Tuple[str, FrozenSet[str]]:
+    """
+    Split a URL into its site and its path tokens.
+
+    Returns:
+        (site, tokens): the host without a leading 'www.' plus any explicit
+        port, which two URLs of the same page must share, and the path
+        segments and query parameters (name=value) as a set
+    """
+    parts = urlsplit(url)
+    site = parts.hostname or ''
+    if site.startswith('www.'):
+        site = site[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        port = None  # Unparseable port; compare the hosts alone
+    if port is not None:
+        site = f"{site}:{port}"
+    tokens = {segment for segment in parts.path.split('/') if segment}
+    tokens.update(param for param in parts.query.split('&') if param)
+    return site, frozenset(tokens)
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two token sets, in [0, 1]; two empty sets are identical"""
+    union = len(a | b)
+    return len(a & b) / union if union else 1.0
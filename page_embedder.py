@@ -0,0 +1,60 @@
+"""
+Local sentence embeddings for page similarity.
+
+Wraps a sentence-transformers model so tab similarity can be computed as a
+cosine (dot product of normalized vectors) instead of one Claude call per pair:
+- Each page is encoded once, when its content arrives
+- Pair similarity is then a single NumPy dot product, with no network or cache
+- sentence-transformers is optional; without it the browser keeps using Claude
+"""
+
+from typing import Optional
+import threading
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+
+class PageEmbedder:
+    """Encodes page text into unit-length embedding vectors"""
+
+    DEFAULT_MODEL = 'all-MiniLM-L6-v2'  # 384-dim, small and fast on CPU
+
+    def __init__(self, model_name: str = DEFAULT_MODEL):
+        self.model_name = model_name
+        self.max_content_chars = 3000  # Same page excerpt the Claude prompt uses
+        self._model = None
+        self._lock = threading.Lock()  # Model loads once, from any worker thread
+
+    @staticmethod
+    def available() -> bool:
+        return SentenceTransformer is not None
+
+    def encode(self, text: str) -> Optional[np.ndarray]:
+        """
+        Embed a page's text. Blocking (loads the model on first use), so call
+        it from a worker thread.
+
+        Returns:
+            Normalized float32 vector, or None for empty text
+        """
+        text = text[:self.max_content_chars].strip()
+        if not text:
+            return None
+
+        with self._lock:
+            if self._model is None:
+                print(f"📦 Loading embedding model {self.model_name}...")
+                self._model = SentenceTransformer(self.model_name)
+            model = self._model
+
+        vector = model.encode(text, normalize_embeddings=True)
+        return np.asarray(vector, dtype=np.float32)
+
+    @staticmethod
+    def similarity(v1: np.ndarray, v2: np.ndarray) -> float:
+        """Cosine similarity of two normalized vectors, clamped to [0, 1]"""
+        return max(0.0, min(1.0, float(np.dot(v1, v2))))